@@ -1,18 +1,50 @@
 """Output directory management, intermediate artifacts, voice demos, and resumability."""
 
+import copy
+import hashlib
 import json
 import os
 import re
 import shutil
-
-from pydub import AudioSegment
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from audiobook_producer.constants import (
     OUTPUT_DIR,
     VOICE_DEMO_PANGRAM,
     PREVIEW_DURATION_MS,
+    TTS_MAX_CONCURRENCY,
 )
-from audiobook_producer.models import Segment
+from audiobook_producer.models import PreviewResult, Segment
+from audiobook_producer.mp3 import duration_ms as mp3_duration_ms
+
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
+# Try to import orjson — much faster parse/dump on large script.json files;
+# fall back to the stdlib json module if not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads(raw: bytes):
+    """Parse JSON bytes with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _dumps(data) -> bytes:
+    """Serialize to 2-space indented JSON bytes with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
 
 
 # Invalidation map: setting key → list of subdirs to delete
@@ -28,6 +60,23 @@ INVALIDATION_MAP = {
     "reverb-wet": ["segments", "samples", "final"],
 }
 
+_SLUG_RE = re.compile(r"[^a-zA-Z0-9]+")
+
+# Parsed JSON artifacts keyed by path → (st_mtime_ns, st_size, data).
+# Status polls and `set` round-trips re-read the same files; a stat is much
+# cheaper than re-parsing. Bounded LRU so long-lived callers don't grow it.
+_ARTIFACT_CACHE_SIZE = 64
+_ARTIFACT_CACHE: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+_ARTIFACT_CACHE_LOCK = threading.Lock()  # load_artifacts() reads from threads
+
+# Content digests of step inputs keyed by path → (st_size, st_mtime_ns,
+# digest), so an unchanged file is hashed at most once per process and a
+# rewritten one replaces its old entry.
+_ARTIFACT_HASH_CACHE: dict[str, tuple[int, int, str]] = {}
+
+# Per-step input digests recorded when a step completes (see record_step_inputs)
+STEP_INPUTS_FILE = ".step_inputs.json"
+
 
 def slug_from_path(story_path: str) -> str:
     """Convert story filename to output directory slug.
@@ -37,7 +86,7 @@ def slug_from_path(story_path: str) -> str:
     """
     basename = os.path.splitext(os.path.basename(story_path))[0]
     # Replace non-alphanumeric with underscore, collapse multiples, strip edges
-    slug = re.sub(r"[^a-zA-Z0-9]+", "_", basename).strip("_").lower()
+    slug = _SLUG_RE.sub("_", basename).strip("_").lower()
     return slug
 
 
@@ -66,24 +115,91 @@ def init_output_dir(story_path: str, output_base: str | None = None) -> str:
     return project_dir
 
 
+def _invalidate_cache(path: str) -> None:
+    """Drop cached artifacts at path, or anywhere beneath it for a directory."""
+    prefix = os.path.join(path, "")
+    with _ARTIFACT_CACHE_LOCK:
+        for key in [k for k in _ARTIFACT_CACHE if k == path or k.startswith(prefix)]:
+            del _ARTIFACT_CACHE[key]
+
+
+def _load_cached(path: str) -> dict | None:
+    """Parse a JSON file, reusing the cached result while mtime and size match.
+
+    Returns the shared cached object — callers must not mutate it.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    with _ARTIFACT_CACHE_LOCK:
+        cached = _ARTIFACT_CACHE.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _ARTIFACT_CACHE.move_to_end(path)
+            return cached[2]
+
+    try:
+        with open(path, "rb") as f:
+            data = _loads(f.read())
+    except FileNotFoundError:
+        return None
+    with _ARTIFACT_CACHE_LOCK:
+        _ARTIFACT_CACHE[path] = (st.st_mtime_ns, st.st_size, data)
+        _ARTIFACT_CACHE.move_to_end(path)
+        if len(_ARTIFACT_CACHE) > _ARTIFACT_CACHE_SIZE:
+            _ARTIFACT_CACHE.popitem(last=False)
+    return data
+
+
 def write_artifact(project_dir: str, filename: str, data: dict) -> str:
     """Write JSON artifact to project_dir/filename.
 
+    Skips the write when the file already holds identical content, so an
+    unchanged artifact keeps its mtime and doesn't make downstream steps
+    look stale to check_step_fresh().
+
     Returns path to the written file.
     """
     path = os.path.join(project_dir, filename)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    payload = _dumps(data)
+    if _same_content(path, payload):
+        return path
+    _invalidate_cache(path)
+    with open(path, "wb") as f:
+        f.write(payload)
     return path
 
 
+def _same_content(path: str, payload: bytes) -> bool:
+    """True if the file at path contains exactly payload."""
+    try:
+        if os.stat(path).st_size != len(payload):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == payload
+    except FileNotFoundError:
+        return False
+
+
 def load_artifact(project_dir: str, filename: str) -> dict | None:
-    """Read JSON artifact. Returns None if file doesn't exist."""
-    path = os.path.join(project_dir, filename)
-    if not os.path.exists(path):
+    """Read JSON artifact. Returns None if file doesn't exist.
+
+    Parsed results are cached in-process; each call returns a fresh copy
+    so callers can modify it before writing it back.
+    """
+    data = _load_cached(os.path.join(project_dir, filename))
+    if data is None:
         return None
-    with open(path) as f:
-        return json.load(f)
+    return copy.deepcopy(data)
+
+
+def load_artifacts(project_dir: str, filenames: list[str]) -> list[dict | None]:
+    """load_artifact() for several files at once, read side by side.
+
+    Returns results in the order of filenames.
+    """
+    with ThreadPoolExecutor(max_workers=max(len(filenames), 1)) as pool:
+        return list(pool.map(lambda name: load_artifact(project_dir, name), filenames))
 
 
 def invalidate_downstream(project_dir: str, setting_key: str) -> list[str]:
@@ -92,78 +208,122 @@ def invalidate_downstream(project_dir: str, setting_key: str) -> list[str]:
     Returns list of deleted subdirectory names.
     """
     dirs_to_delete = INVALIDATION_MAP.get(setting_key, [])
-    deleted = []
-    for subdir in dirs_to_delete:
+    if not dirs_to_delete:
+        return []
+
+    def _clear(subdir: str) -> str | None:
         path = os.path.join(project_dir, subdir)
-        if os.path.exists(path):
-            shutil.rmtree(path)
-            os.makedirs(path, exist_ok=True)  # recreate empty dir
-            deleted.append(subdir)
-    return deleted
+        if not os.path.exists(path):
+            return None
+        shutil.rmtree(path)
+        os.makedirs(path, exist_ok=True)  # recreate empty dir
+        return subdir
+
+    for subdir in dirs_to_delete:
+        _invalidate_cache(os.path.join(project_dir, subdir))
+
+    # Each tree is unlink-bound; clear them side by side
+    with ThreadPoolExecutor(max_workers=len(dirs_to_delete)) as pool:
+        return [subdir for subdir in pool.map(_clear, dirs_to_delete) if subdir]
 
 
 def get_project_status(project_dir: str) -> dict:
     """Return dict describing current state of each pipeline step."""
+    snapshot = _project_snapshot(project_dir)
+    top = snapshot[""]
     status = {}
 
     # Parse step
-    script = os.path.join(project_dir, "script.json")
-    if os.path.exists(script):
-        with open(script) as f:
-            data = json.load(f)
+    data = _load_cached(os.path.join(project_dir, "script.json")) if "script.json" in top else None
+    if data is not None:
         seg_count = len(data.get("segments", []))
         status["parse"] = {"state": "done", "segments": seg_count}
     else:
         status["parse"] = {"state": "pending"}
 
     # Voices step
-    cast = os.path.join(project_dir, "cast.json")
-    if os.path.exists(cast):
-        with open(cast) as f:
-            data = json.load(f)
+    data = _load_cached(os.path.join(project_dir, "cast.json")) if "cast.json" in top else None
+    if data is not None:
         char_count = len(data.get("characters", {})) + 1  # +1 for narrator
         status["voices"] = {"state": "done", "voices": char_count}
     else:
         status["voices"] = {"state": "pending"}
 
     # TTS step
-    seg_dir = os.path.join(project_dir, "segments")
-    if os.path.exists(seg_dir):
-        mp3s = [f for f in os.listdir(seg_dir) if f.endswith(".mp3")]
-        if mp3s:
-            expected = status.get("parse", {}).get("segments", 0)
-            if expected and len(mp3s) >= expected:
-                status["tts"] = {"state": "done", "files": len(mp3s)}
-            else:
-                status["tts"] = {"state": "partial", "files": len(mp3s), "expected": expected}
+    mp3_count = _count_mp3s(snapshot["segments"])
+    if mp3_count:
+        expected = status.get("parse", {}).get("segments", 0)
+        if expected and mp3_count >= expected:
+            status["tts"] = {"state": "done", "files": mp3_count}
         else:
-            status["tts"] = {"state": "pending"}
+            status["tts"] = {"state": "partial", "files": mp3_count, "expected": expected}
     else:
         status["tts"] = {"state": "pending"}
 
     # Effects step
-    effects_json = os.path.join(project_dir, "effects.json")
-    status["effects"] = {"state": "done" if os.path.exists(effects_json) else "pending"}
+    status["effects"] = {"state": "done" if "effects.json" in top else "pending"}
 
     # Music step
-    bg = os.path.join(project_dir, "music", "background.mp3")
-    status["music"] = {"state": "done" if os.path.exists(bg) else "pending"}
+    status["music"] = {"state": "done" if "background.mp3" in snapshot["music"] else "pending"}
 
     # Assembly step (check for preview or final)
-    preview = os.path.join(project_dir, "samples", "preview_60s.mp3")
-    status["assembly"] = {"state": "done" if os.path.exists(preview) else "pending"}
+    preview_done = "preview_60s.mp3" in snapshot["samples"]
+    status["assembly"] = {"state": "done" if preview_done else "pending"}
 
     # Export step
-    final_dir = os.path.join(project_dir, "final")
-    if os.path.exists(final_dir):
-        mp3s = [f for f in os.listdir(final_dir) if f.endswith(".mp3")]
-        status["export"] = {"state": "done" if mp3s else "pending"}
-    else:
-        status["export"] = {"state": "pending"}
+    has_final = _count_mp3s(snapshot["final"], limit=1) > 0
+    status["export"] = {"state": "done" if has_final else "pending"}
 
     return status
 
 
+# Step name → (subdir, filename) of its output indicator; a None filename
+# means the step's output is the whole subdir ("" is the project root).
+_STEP_OUTPUTS = {
+    "parse": ("", "script.json"),
+    "voices": ("", "cast.json"),
+    "voice_demos": ("voice_demos", None),
+    "tts": ("segments", None),
+    "effects": ("", "effects.json"),
+    "music": ("music", "background.mp3"),
+    "assembly": ("samples", "preview_60s.mp3"),
+    "export": ("final", None),
+}
+
+
+def _scan_dir(directory: str) -> dict[str, os.DirEntry]:
+    """Map entry names to DirEntry objects (empty if the directory is missing)."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return {}
+
+
+def _project_snapshot(project_dir: str) -> dict[str, dict[str, os.DirEntry]]:
+    """Scan the project root and every step-output subdir once.
+
+    get_project_status() tests membership in these listings instead
+    of issuing an exists()/stat() per file.
+    """
+    subdirs = {subdir for subdir, _ in _STEP_OUTPUTS.values()}
+    return {
+        subdir: _scan_dir(os.path.join(project_dir, subdir))
+        for subdir in subdirs
+    }
+
+
+def _count_mp3s(entries: dict[str, os.DirEntry], limit: int | None = None) -> int:
+    """Count .mp3 files in a directory listing, stopping once limit is reached."""
+    count = 0
+    for name, entry in entries.items():
+        if name.endswith(".mp3") and entry.is_file(follow_symlinks=False):
+            count += 1
+            if limit is not None and count >= limit:
+                break
+    return count
+
+
 def list_projects(output_base: str | None = None) -> list[str]:
     """List all project slugs under the output directory.
 
@@ -171,15 +331,15 @@ def list_projects(output_base: str | None = None) -> list[str]:
     """
     if output_base is None:
         output_base = OUTPUT_DIR
-    if not os.path.exists(output_base):
+    try:
+        with os.scandir(output_base) as it:
+            projects = [
+                entry.name for entry in it
+                if entry.is_dir()
+                and os.path.exists(os.path.join(entry.path, "script.json"))
+            ]
+    except FileNotFoundError:
         return []
-    projects = []
-    for name in os.listdir(output_base):
-        project_dir = os.path.join(output_base, name)
-        if os.path.isdir(project_dir):
-            script = os.path.join(project_dir, "script.json")
-            if os.path.exists(script):
-                projects.append(name)
     return sorted(projects)
 
 
@@ -202,6 +362,7 @@ def generate_voice_demos(
     os.makedirs(demo_dir, exist_ok=True)
 
     paths = []
+    jobs = []  # (text, voice, path) for demos not generated yet
 
     # Collect all unique characters + narrator
     characters = {}  # speaker -> voice
@@ -211,12 +372,17 @@ def generate_voice_demos(
     for name, info in cast_data.get("characters", {}).items():
         characters[name] = info.get("voice", "")
 
-    # Find first dialogue line per character
+    # Find first dialogue line per character, stopping once all are found
+    wanted = {speaker.lower() for speaker in characters}
     first_lines = {}
     for seg in segments:
+        if seg.type != "dialogue":
+            continue
         speaker = seg.speaker.lower()
-        if speaker not in first_lines and seg.type == "dialogue":
+        if speaker in wanted and speaker not in first_lines:
             first_lines[speaker] = seg.text
+            if len(first_lines) == len(wanted):
+                break
 
     for speaker, voice in characters.items():
         if not voice:
@@ -227,7 +393,7 @@ def generate_voice_demos(
         # Pangram demo
         pangram_path = os.path.join(demo_dir, f"{speaker_slug}_pangram.mp3")
         if not os.path.exists(pangram_path):
-            generate_single(VOICE_DEMO_PANGRAM, voice, pangram_path)
+            jobs.append((VOICE_DEMO_PANGRAM, voice, pangram_path))
         paths.append(pangram_path)
 
         # Story line demo (if character has dialogue)
@@ -235,40 +401,62 @@ def generate_voice_demos(
         if story_line:
             story_path = os.path.join(demo_dir, f"{speaker_slug}_story.mp3")
             if not os.path.exists(story_path):
-                generate_single(story_line, voice, story_path)
+                jobs.append((story_line, voice, story_path))
             paths.append(story_path)
 
+    # TTS calls are network-bound, so run them concurrently
+    if jobs:
+        with ThreadPoolExecutor(max_workers=min(TTS_MAX_CONCURRENCY, len(jobs))) as pool:
+            list(pool.map(lambda job: generate_single(*job), jobs))
+
     return paths
 
 
 def generate_preview(
     project_dir: str,
-    assembled_audio: AudioSegment,
+    assembled_audio: "AudioSegment",
     duration_ms: int = PREVIEW_DURATION_MS,
-) -> str:
+    source_mp3: str | None = None,
+) -> PreviewResult:
     """Generate a preview clip from assembled audio.
 
     Trims to first duration_ms, saves to samples/preview_60s.mp3.
-    Returns path to preview file.
+    If source_mp3 is the exported production, the clip is cut from it
+    with ffmpeg stream copy instead of being encoded again, and its
+    length is taken from that file rather than from assembled_audio.
+    Returns the preview's path and length; the length is known from the
+    audio, so callers never need to decode the clip to learn it.
     """
     samples_dir = os.path.join(project_dir, "samples")
     os.makedirs(samples_dir, exist_ok=True)
 
-    preview = assembled_audio[:duration_ms]
     path = os.path.join(samples_dir, "preview_60s.mp3")
-    preview.export(path, format="mp3")
-    return path
+    if source_mp3:
+        source_ms = mp3_duration_ms(source_mp3)
+        clip_ms = min(duration_ms, source_ms)
+        # A clip of the whole file runs to EOF rather than to a computed end
+        _cut_mp3(source_mp3, 0, clip_ms if clip_ms < source_ms else None, path)
+    else:
+        clip_ms = min(duration_ms, len(assembled_audio))
+        assembled_audio[:clip_ms].export(path, format="mp3")
+    return PreviewResult(path=path, duration_ms=clip_ms)
 
 
 def split_chapters(
     project_dir: str,
-    assembled_audio: AudioSegment,
+    assembled_audio: "AudioSegment",
     segments: list[Segment],
+    source_mp3: str | None = None,
 ) -> list[str]:
     """Split long stories into chapter-level MP3s.
 
     Stories with >50 segments get chapter splits (~10 min each).
     Short stories return empty list (no chapters).
+
+    If source_mp3 is the exported production, chapters are cut from it
+    with ffmpeg stream copy instead of re-encoding slices of the audio.
+    Chapter offsets then follow that file's own length, and the last
+    chapter runs to its end.
     """
     if len(segments) <= 50:
         return []
@@ -278,27 +466,57 @@ def split_chapters(
 
     # Target ~10 minutes per chapter
     target_chapter_ms = 10 * 60 * 1000
-    total_ms = len(assembled_audio)
+    total_ms = mp3_duration_ms(source_mp3) if source_mp3 else len(assembled_audio)
 
     if total_ms <= target_chapter_ms:
         return []
 
     paths = []
+    chapters = []
     chapter_num = 1
     pos = 0
 
     while pos < total_ms:
         end = min(pos + target_chapter_ms, total_ms)
-        chapter = assembled_audio[pos:end]
         path = os.path.join(chapters_dir, f"chapter_{chapter_num:02d}.mp3")
-        chapter.export(path, format="mp3")
+        chapters.append((pos, end, path))
         paths.append(path)
         chapter_num += 1
         pos = end
 
+    if source_mp3:
+        def write_chapter(job):
+            start, end, path = job
+            _cut_mp3(source_mp3, start, end if end < total_ms else None, path)
+    else:
+        def write_chapter(job):
+            assembled_audio[job[0]:job[1]].export(job[2], format="mp3")
+
+    # Each chapter runs its own ffmpeg process; run them side by side
+    with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(chapters))) as pool:
+        list(pool.map(write_chapter, chapters))
+
     return paths
 
 
+def _cut_mp3(src_path: str, start_ms: int, end_ms: int | None, out_path: str) -> None:
+    """Copy the [start_ms, end_ms) span of an MP3 to out_path without re-encoding.
+
+    An end_ms of None copies through to the end of the file.
+    """
+    from pydub import AudioSegment
+
+    cmd = [
+        AudioSegment.converter, "-y", "-loglevel", "error",
+        "-ss", f"{start_ms / 1000:.3f}",
+        "-i", src_path,
+    ]
+    if end_ms is not None:
+        cmd += ["-t", f"{(end_ms - start_ms) / 1000:.3f}"]
+    cmd += ["-c", "copy", out_path]
+    subprocess.run(cmd, check=True, capture_output=True)
+
+
 def check_step_fresh(
     project_dir: str,
     step_name: str,
@@ -308,43 +526,73 @@ def check_step_fresh(
 
     Returns True if output exists and all input mtimes are older than output.
     """
-    # Map step names to their output indicators
-    output_map = {
-        "parse": os.path.join(project_dir, "script.json"),
-        "voices": os.path.join(project_dir, "cast.json"),
-        "tts": os.path.join(project_dir, "segments"),
-        "effects": os.path.join(project_dir, "effects.json"),
-        "music": os.path.join(project_dir, "music", "background.mp3"),
-        "assembly": os.path.join(project_dir, "samples", "preview_60s.mp3"),
-        "export": os.path.join(project_dir, "final"),
-    }
-
-    output_path = output_map.get(step_name)
-    if not output_path or not os.path.exists(output_path):
+    if step_name not in _STEP_OUTPUTS:
         return False
+    subdir, filename = _STEP_OUTPUTS[step_name]
+    entries = _scan_dir(os.path.join(project_dir, subdir))
 
-    # For directories, check if they have any files
-    if os.path.isdir(output_path):
-        contents = os.listdir(output_path)
-        if not contents:
+    if filename is None:
+        # Directory output: use the most recent file; empty means stale
+        if not entries:
             return False
-        # Use most recent file in directory
-        output_mtime = max(
-            os.path.getmtime(os.path.join(output_path, f))
-            for f in contents
-        )
+        output_mtime = max(entry.stat().st_mtime for entry in entries.values())
     else:
-        output_mtime = os.path.getmtime(output_path)
+        if filename not in entries:
+            return False
+        output_mtime = entries[filename].stat().st_mtime
 
     # If no input paths specified, just check existence
     if not input_paths:
         return True
 
     # Check all inputs are older than output
+    newer = []
     for input_path in input_paths:
-        if not os.path.exists(input_path):
+        try:
+            if os.path.getmtime(input_path) > output_mtime:
+                newer.append(input_path)
+        except FileNotFoundError:
             continue
-        if os.path.getmtime(input_path) > output_mtime:
-            return False
+    if not newer:
+        return True
+
+    # A newer mtime alone (touch, identical rewrite) doesn't make the step
+    # stale if the content still matches what the step last ran on
+    recorded = (_load_cached(os.path.join(project_dir, STEP_INPUTS_FILE)) or {}).get(step_name, {})
+    return all(
+        path in recorded and recorded[path] == _file_digest(path)
+        for path in newer
+    )
 
-    return True
+
+def _file_digest(path: str) -> str | None:
+    """sha256 of a file's contents, cached until its size or mtime changes."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    cached = _ARTIFACT_HASH_CACHE.get(path)
+    if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+        return cached[2]
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+    _ARTIFACT_HASH_CACHE[path] = (st.st_size, st.st_mtime_ns, digest)
+    return digest
+
+
+def record_step_inputs(project_dir: str, step_name: str, input_paths: list[str]) -> None:
+    """Remember the content of a step's inputs after the step has run.
+
+    check_step_fresh() then treats inputs with a newer mtime but identical
+    content as unchanged instead of re-running the step.
+    """
+    recorded = load_artifact(project_dir, STEP_INPUTS_FILE) or {}
+    recorded[step_name] = {
+        path: digest
+        for path in input_paths
+        if (digest := _file_digest(path)) is not None
+    }
+    write_artifact(project_dir, STEP_INPUTS_FILE, recorded)
@@ -1,5 +1,11 @@
 """Assemble audio segments with bookend music structure."""
 
+import os
+import subprocess
+import tempfile
+from functools import lru_cache
+
+import numpy as np
 from pydub import AudioSegment
 
 from audiobook_producer.constants import (
@@ -11,6 +17,7 @@ from audiobook_producer.constants import (
     MUSIC_BED_DB,
     MUSIC_FADE_MS,
 )
+from audiobook_producer.mp3 import stream_samples
 from audiobook_producer.models import Segment
 
 
@@ -30,6 +37,57 @@ def _calculate_pause(prev: Segment, curr: Segment) -> int:
     return pause
 
 
+@lru_cache(maxsize=16)
+def _silence(
+    duration_ms: int, frame_rate: int, channels: int, sample_width: int,
+) -> AudioSegment:
+    """Silence in the given format, cached per unique duration/format.
+
+    There are only a handful of pause lengths, so every gap in a production
+    shares one of a few buffers instead of zero-filling a fresh one.
+    """
+    silence = AudioSegment.silent(duration=duration_ms, frame_rate=frame_rate)
+    return silence.set_channels(channels).set_sample_width(sample_width)
+
+
+def _conform(
+    seg: AudioSegment, frame_rate: int, channels: int, sample_width: int,
+) -> AudioSegment:
+    """Convert a segment to the given format, skipping no-op conversions."""
+    if seg.frame_rate != frame_rate:
+        seg = seg.set_frame_rate(frame_rate)
+    if seg.channels != channels:
+        seg = seg.set_channels(channels)
+    if seg.sample_width != sample_width:
+        seg = seg.set_sample_width(sample_width)
+    return seg
+
+
+def _join(parts: list[AudioSegment]) -> AudioSegment:
+    """Concatenate segments in a single pass.
+
+    Chained ``+`` re-copies the accumulated buffer on every step (quadratic
+    in the number of parts). Here every part is converted to the common
+    format once -- the same max frame rate/channels/sample width pydub's
+    ``+`` would pick -- and the raw PCM is joined in one copy.
+    """
+    frame_rate = max(p.frame_rate for p in parts)
+    channels = max(p.channels for p in parts)
+    sample_width = max(p.sample_width for p in parts)
+
+    chunks = [
+        _conform(part, frame_rate, channels, sample_width).raw_data
+        for part in parts
+    ]
+
+    return AudioSegment(
+        data=b"".join(chunks),
+        sample_width=sample_width,
+        frame_rate=frame_rate,
+        channels=channels,
+    )
+
+
 def _concatenate_with_pauses(
     segments: list[Segment],
     audio_files: list[AudioSegment],
@@ -38,25 +96,82 @@ def _concatenate_with_pauses(
     if not audio_files:
         return AudioSegment.silent(duration=0)
 
-    result = audio_files[0]
+    frame_rate = max(a.frame_rate for a in audio_files)
+    channels = max(a.channels for a in audio_files)
+    sample_width = max(a.sample_width for a in audio_files)
+
+    parts = [audio_files[0]]
     for i in range(1, len(audio_files)):
         pause_ms = _calculate_pause(segments[i - 1], segments[i])
-        result += AudioSegment.silent(duration=pause_ms) + audio_files[i]
+        parts.append(_silence(pause_ms, frame_rate, channels, sample_width))
+        parts.append(audio_files[i])
+
+    return _join(parts)
+
+
+def _frames(seg: AudioSegment) -> np.ndarray:
+    """View a segment's PCM as a (frames, channels) array without copying."""
+    samples = np.frombuffer(seg.raw_data, dtype=seg.array_type)
+    return samples.reshape(-1, seg.channels)
+
+
+def _loop(samples: np.ndarray, n_frames: int) -> np.ndarray:
+    """Loop or trim a (frames, channels) array to exactly n_frames."""
+    if len(samples) == 0:
+        return np.zeros((n_frames, samples.shape[1]), dtype=samples.dtype)
+    # Tile the samples once instead of growing the segment repeatedly
+    repeats = -(-n_frames // len(samples))
+    return np.tile(samples, (repeats, 1))[:n_frames]
+
+
+@lru_cache(maxsize=8)
+def _fade_ramp(n_frames: int) -> np.ndarray:
+    """Read-only 0→1 linear ramp shaped (n_frames, 1) to broadcast over channels."""
+    ramp = np.linspace(0.0, 1.0, n_frames, dtype=np.float32)[:, None]
+    ramp.flags.writeable = False
+    return ramp
+
 
-    return result
+def _render_bed(
+    samples: np.ndarray,
+    template: AudioSegment,
+    n_frames: int,
+    gain_db: float = 0.0,
+    fade_in_ms: int = 0,
+    fade_out_ms: int = 0,
+    narration: AudioSegment | None = None,
+    overlay_pos_ms: int = 0,
+) -> AudioSegment:
+    """Loop music samples to n_frames, then gain, fade and overlay in one pass.
+
+    `template` supplies the output format; `narration` must already be in
+    it. Without gain/fades/narration the looped samples are used as-is.
+    """
+    looped = _loop(samples, n_frames)
+    if not (gain_db or fade_in_ms or fade_out_ms or narration is not None):
+        return template._spawn(looped.tobytes())
 
+    frame_rate = template.frame_rate
+    # Int → float conversion and gain in a single pass
+    gain = np.float32(10 ** (gain_db / 20))
+    bed = np.multiply(looped, gain, dtype=np.float32)
 
-def _build_music_bed(music: AudioSegment, duration_ms: int) -> AudioSegment:
-    """Loop or trim music to fit a given duration."""
-    if len(music) == 0:
-        return AudioSegment.silent(duration=duration_ms)
+    n_fade_in = min(int(fade_in_ms * frame_rate / 1000), len(bed))
+    if n_fade_in:
+        bed[:n_fade_in] *= _fade_ramp(n_fade_in)
+    n_fade_out = min(int(fade_out_ms * frame_rate / 1000), len(bed))
+    if n_fade_out:
+        bed[-n_fade_out:] *= _fade_ramp(n_fade_out)[::-1]
 
-    # Loop music until it covers the needed duration
-    result = music
-    while len(result) < duration_ms:
-        result += music
+    if narration is not None:
+        narr = _frames(narration)
+        start = min(int(overlay_pos_ms * frame_rate / 1000), len(bed))
+        end = min(start + len(narr), len(bed))
+        bed[start:end] += narr[:end - start]
 
-    return result[:duration_ms]
+    info = np.iinfo(looped.dtype)
+    np.clip(bed, info.min, info.max, out=bed)
+    return template._spawn(bed.astype(looped.dtype).tobytes())
 
 
 def assemble(
@@ -89,55 +204,190 @@ def assemble(
 
     if no_music or music is None:
         # No music mode: just concatenate everything with pauses between sections
-        section_pause = AudioSegment.silent(duration=PAUSE_TYPE_TRANSITION_MS)
-        return intro_concat + section_pause + story_concat + section_pause + outro_concat
+        section_pause = _silence(
+            PAUSE_TYPE_TRANSITION_MS,
+            story_concat.frame_rate, story_concat.channels, story_concat.sample_width,
+        )
+        return _join([intro_concat, section_pause, story_concat, section_pause, outro_concat])
 
     # === Bookend music structure ===
 
+    # Bring music and narration to the production's common format once (the
+    # format the final join would pick anyway), and read the music samples a
+    # single time for all four music sections.
+    parts = [music, intro_concat, story_concat, outro_concat]
+    frame_rate = max(p.frame_rate for p in parts)
+    channels = max(p.channels for p in parts)
+    sample_width = max(p.sample_width for p in parts)
+    music = _conform(music, frame_rate, channels, sample_width)
+    intro_concat = _conform(intro_concat, frame_rate, channels, sample_width)
+    outro_concat = _conform(outro_concat, frame_rate, channels, sample_width)
+    music_samples = _frames(music)
+
+    def n_frames(duration_ms: int) -> int:
+        return int(duration_ms * frame_rate / 1000)
+
     # --- INTRO BOOKEND ---
     # 1. Music solo at full volume
-    intro_solo = _build_music_bed(music, intro_music_solo_ms)
+    intro_solo = _render_bed(music_samples, music, n_frames(intro_music_solo_ms))
 
     # 2. Music bed under intro narration (music fades down, plays under narration)
     intro_narration_duration = len(intro_concat)
     # Music bed: fade down + play under intro + fade out at end
     intro_bed_duration = music_fade_ms + intro_narration_duration + music_fade_ms
-    intro_bed_music = _build_music_bed(music, intro_bed_duration)
-    # Apply volume reduction and fades
-    intro_bed_music = intro_bed_music + music_bed_db  # reduce volume
-    intro_bed_music = intro_bed_music.fade_in(music_fade_ms)  # fade from silence to bed level
-    intro_bed_music = intro_bed_music.fade_out(music_fade_ms)  # fade out at end
-
-    # Overlay intro narration centered on the music bed
-    intro_with_bed = intro_bed_music.overlay(intro_concat, position=music_fade_ms)
+    # Reduce volume, fade in/out at the edges, and overlay intro narration
+    # centered on the music bed
+    intro_with_bed = _render_bed(
+        music_samples, music, n_frames(intro_bed_duration),
+        gain_db=music_bed_db, fade_in_ms=music_fade_ms, fade_out_ms=music_fade_ms,
+        narration=intro_concat, overlay_pos_ms=music_fade_ms,
+    )
 
     # --- STORY BODY (no music) ---
-    story_padding = AudioSegment.silent(duration=PAUSE_TYPE_TRANSITION_MS)
+    story_padding = _silence(
+        PAUSE_TYPE_TRANSITION_MS,
+        story_concat.frame_rate, story_concat.channels, story_concat.sample_width,
+    )
 
     # --- OUTRO BOOKEND ---
     outro_narration_duration = len(outro_concat)
     # Music bed under outro
     outro_bed_duration = music_fade_ms + outro_narration_duration + music_fade_ms
-    outro_bed_music = _build_music_bed(music, outro_bed_duration)
-    outro_bed_music = outro_bed_music + music_bed_db
-    outro_bed_music = outro_bed_music.fade_in(music_fade_ms)
-    outro_bed_music = outro_bed_music.fade_out(music_fade_ms)
-
-    outro_with_bed = outro_bed_music.overlay(outro_concat, position=music_fade_ms)
+    outro_with_bed = _render_bed(
+        music_samples, music, n_frames(outro_bed_duration),
+        gain_db=music_bed_db, fade_in_ms=music_fade_ms, fade_out_ms=music_fade_ms,
+        narration=outro_concat, overlay_pos_ms=music_fade_ms,
+    )
 
     # Music solo at end with fade out
-    outro_solo = _build_music_bed(music, outro_music_solo_ms)
-    outro_solo = outro_solo.fade_out(music_fade_ms)
+    outro_solo = _render_bed(
+        music_samples, music, n_frames(outro_music_solo_ms), fade_out_ms=music_fade_ms,
+    )
 
     # Assemble all sections
-    result = (
-        intro_solo
-        + intro_with_bed
-        + story_padding
-        + story_concat
-        + story_padding
-        + outro_with_bed
-        + outro_solo
-    )
+    return _join([
+        intro_solo,
+        intro_with_bed,
+        story_padding,
+        story_concat,
+        story_padding,
+        outro_with_bed,
+        outro_solo,
+    ])
+
+
+# LAME's encoder delay (576 + 529 decoder delay), in samples
+_LAME_DELAY_SAMPLES = 1105
+
+
+def _silence_mp3(n_frames: int, frame_rate: int, channels: int, silence_dir: str) -> tuple[str, int]:
+    """An MP3 of n_frames frames of silence, encoded once per silence_dir.
 
-    return result
+    Returns (path, samples in its frames). LAME pads its input with the
+    encoder delay and rounds up to whole frames, so the input length is
+    picked to land on n_frames and checked against the file.
+    """
+    path = os.path.join(silence_dir, f"_silence_{n_frames}f_{frame_rate}_{channels}.mp3")
+    if not os.path.exists(path):
+        samples_per_frame = 1152 if frame_rate >= 32000 else 576
+        n_samples = max(1, n_frames * samples_per_frame - _LAME_DELAY_SAMPLES)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        for _ in range(3):
+            silence = AudioSegment(
+                data=bytes(2 * channels * n_samples),
+                sample_width=2, frame_rate=frame_rate, channels=channels,
+            )
+            silence.export(tmp, format="mp3")
+            got = stream_samples(tmp)[0] // samples_per_frame
+            if got == n_frames:
+                break
+            n_samples = max(1, n_samples + (n_frames - got) * samples_per_frame)
+        os.replace(tmp, path)
+    return path, stream_samples(path)[0]
+
+
+def assemble_streamcopy(
+    intro_segments: list[Segment],
+    intro_paths: list[str],
+    story_segments: list[Segment],
+    story_paths: list[str],
+    outro_segments: list[Segment],
+    outro_paths: list[str],
+    sample_counts: list[int],
+    out_path: str,
+    silence_dir: str,
+    frame_rate: int,
+    channels: int,
+) -> str:
+    """Stitch segment MP3s into one file without re-encoding them.
+
+    Fast path for no-music productions: lays out the same sequence as
+    assemble(no_music=True) -- type-aware pauses within each section and a
+    transition pause between sections -- using pre-encoded silence MP3s,
+    then joins the files with ffmpeg's concat demuxer in stream-copy mode.
+    It saves only the final MP3 encode: the caller still decodes every
+    segment and runs assemble() as it would for the encoded export.
+
+    Each MP3 carries encoder delay and end padding, so a file adds more
+    audio to the stream than it decodes to. The pauses absorb this: each
+    silence is a whole number of MP3 frames, picked so the running length
+    tracks assemble()'s timeline, which keeps every gap within half a frame
+    of its pause and stops the error from accumulating over a book.
+
+    sample_counts holds the decoded length, in samples, of every path in
+    intro, story, outro order. All inputs must share frame_rate/channels.
+
+    Returns out_path. Raises subprocess.CalledProcessError if ffmpeg fails.
+    """
+    os.makedirs(silence_dir, exist_ok=True)
+    samples_per_frame = 1152 if frame_rate >= 32000 else 576
+
+    # Positions in samples: where assemble() would be vs. the MP3 stream so far
+    target = 0
+    laid = 0
+    playlist = []
+
+    def add_pause(pause_ms: int) -> None:
+        nonlocal target, laid
+        target += int(pause_ms * frame_rate / 1000)
+        n_frames = round((target - laid) / samples_per_frame)
+        if n_frames > 0:
+            silence, samples = _silence_mp3(n_frames, frame_rate, channels, silence_dir)
+            playlist.append(silence)
+            laid += samples
+
+    counts = iter(sample_counts)
+    sections = [
+        (intro_segments, intro_paths),
+        (story_segments, story_paths),
+        (outro_segments, outro_paths),
+    ]
+    for n, (segments, paths) in enumerate(sections):
+        if n:
+            add_pause(PAUSE_TYPE_TRANSITION_MS)
+        for i, path in enumerate(paths):
+            if i:
+                add_pause(_calculate_pause(segments[i - 1], segments[i]))
+            playlist.append(path)
+            target += next(counts)
+            laid += stream_samples(path)[0]
+
+    fd, list_path = tempfile.mkstemp(suffix=".txt", dir=silence_dir)
+    try:
+        with os.fdopen(fd, "w") as f:
+            for path in playlist:
+                escaped = os.path.abspath(path).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        subprocess.run(
+            [
+                AudioSegment.converter, "-y", "-loglevel", "error",
+                "-f", "concat", "-safe", "0", "-i", list_path,
+                "-c", "copy", out_path,
+            ],
+            check=True,
+            capture_output=True,
+        )
+    finally:
+        os.remove(list_path)
+
+    return out_path
@@ -1,18 +1,30 @@
 """CLI interface with subcommand routing and pipeline orchestration."""
 
 import argparse
+import functools
 import json
+import operator
 import os
 import shutil
+import subprocess
 import sys
-
-from pydub import AudioSegment
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from audiobook_producer.constants import (
     OUTPUT_DIR,
     NARRATOR_VOICE,
     NARRATOR_DIALOGUE_VOICE,
     MUSIC_BED_DB,
+    MUSIC_FADE_MS,
+    MP3_DECODER,
+    INTRO_MUSIC_SOLO_MS,
+    OUTRO_MUSIC_SOLO_MS,
+    PAUSE_SAME_TYPE_MS,
+    PAUSE_SPEAKER_CHANGE_MS,
+    PAUSE_TYPE_TRANSITION_MS,
     REVERB_ROOM_SIZE,
     REVERB_WET_LEVEL,
     NARRATOR_REVERB_ROOM_SIZE,
@@ -28,16 +40,12 @@ from audiobook_producer.voices import (
     generate_outro_segments,
     VOICE_POOL,
 )
-from audiobook_producer.tts import generate_tts
-from audiobook_producer.music import generate_music, load_and_prepare_music
-from audiobook_producer.effects import process_segments
-from audiobook_producer.assembly import assemble
-from audiobook_producer.exporter import export
 from audiobook_producer.artifacts import (
     init_output_dir,
     slug_from_path,
     write_artifact,
     load_artifact,
+    load_artifacts,
     invalidate_downstream,
     get_project_status,
     list_projects,
@@ -45,8 +53,14 @@ from audiobook_producer.artifacts import (
     generate_preview,
     split_chapters,
     check_step_fresh,
+    record_step_inputs,
 )
 
+# The audio stack (pydub, numpy, edge-tts) is imported inside the commands
+# that produce audio, so list/status/voices/set start without paying for it.
+if TYPE_CHECKING:
+    from pydub import AudioSegment
+
 
 def _check_ffmpeg():
     """Verify ffmpeg is installed."""
@@ -115,21 +129,23 @@ def cmd_new(args):
     intro_segments = generate_intro_segments(title, author, segments, cast=cast)
     outro_segments = generate_outro_segments(title, author, segments)
 
-    # Write artifacts
+    # Write artifacts (attrgetter pulls each segment's fields in one C call)
+    story_fields = operator.attrgetter("type", "text", "speaker")
+    bookend_fields = operator.attrgetter("type", "text", "speaker", "voice")
     script_data = {
         "metadata": {"title": title, "author": author},
         "source": os.path.abspath(file_path),
         "segments": [
-            {"type": s.type, "text": s.text, "speaker": s.speaker}
-            for s in segments
+            {"type": t, "text": x, "speaker": sp}
+            for t, x, sp in map(story_fields, segments)
         ],
         "intro_segments": [
-            {"type": s.type, "text": s.text, "speaker": s.speaker, "voice": s.voice}
-            for s in intro_segments
+            {"type": t, "text": x, "speaker": sp, "voice": v}
+            for t, x, sp, v in map(bookend_fields, intro_segments)
         ],
         "outro_segments": [
-            {"type": s.type, "text": s.text, "speaker": s.speaker, "voice": s.voice}
-            for s in outro_segments
+            {"type": t, "text": x, "speaker": sp, "voice": v}
+            for t, x, sp, v in map(bookend_fields, outro_segments)
         ],
     }
     write_artifact(project_dir, "script.json", script_data)
@@ -140,14 +156,14 @@ def cmd_new(args):
 
     # Write direction.json (assembly defaults)
     direction = {
-        "intro_music_solo_ms": 4000,
-        "outro_music_solo_ms": 4000,
+        "intro_music_solo_ms": INTRO_MUSIC_SOLO_MS,
+        "outro_music_solo_ms": OUTRO_MUSIC_SOLO_MS,
         "music_bed_db": MUSIC_BED_DB,
-        "music_fade_ms": 2000,
+        "music_fade_ms": MUSIC_FADE_MS,
         "pauses": {
-            "same_type_ms": 300,
-            "speaker_change_ms": 500,
-            "type_transition_ms": 700,
+            "same_type_ms": PAUSE_SAME_TYPE_MS,
+            "speaker_change_ms": PAUSE_SPEAKER_CHANGE_MS,
+            "type_transition_ms": PAUSE_TYPE_TRANSITION_MS,
         },
         "no_music": False,
         "music_source": None,
@@ -165,10 +181,9 @@ def cmd_new(args):
     write_artifact(project_dir, "effects.json", effects)
 
     # Summary
-    narration_count = sum(1 for s in segments if s.type == "narration")
-    dialogue_count = sum(1 for s in segments if s.type == "dialogue")
+    counts = Counter(s.type for s in segments)
     print(f"Created project: {slug}")
-    print(f"Parsed {len(segments)} segments ({narration_count} narration, {dialogue_count} dialogue)")
+    print(f"Parsed {len(segments)} segments ({counts['narration']} narration, {counts['dialogue']} dialogue)")
     print(f"Cast written to {OUTPUT_DIR}/{slug}/cast.json")
     print(f"Run 'producer.py status {slug}' to review, or 'producer.py run {slug}' to generate audio.")
 
@@ -187,21 +202,23 @@ def _build_cast_data(segments: list[Segment], cast: dict) -> dict:
     if narrator_info.get("description"):
         cast_data["narrator"]["description"] = narrator_info["description"]
 
+    # Cast file names are matched case-insensitively; first entry wins
+    cast_lower = {}
+    for name, info in cast_entries.items():
+        cast_lower.setdefault(name.lower(), info)
+
     characters = {}
-    seen = set()
     for seg in segments:
         speaker = seg.speaker.lower()
-        if speaker in ("narrator", "unknown") or speaker in seen:
+        if speaker in ("narrator", "unknown") or speaker in characters:
             continue
-        seen.add(speaker)
         char_info = {"voice": seg.voice}
         # Check cast for description
-        for name, info in cast_entries.items():
-            if name.lower() == speaker:
-                if info.get("description"):
-                    char_info["description"] = info["description"]
-                char_info["source"] = "cast_file"
-                break
+        info = cast_lower.get(speaker)
+        if info is not None:
+            if info.get("description"):
+                char_info["description"] = info["description"]
+            char_info["source"] = "cast_file"
         else:
             char_info["source"] = "hash"
         characters[speaker] = char_info
@@ -212,6 +229,14 @@ def _build_cast_data(segments: list[Segment], cast: dict) -> dict:
 
 def cmd_run(args):
     """Run the production pipeline."""
+    from pydub import AudioSegment
+
+    from audiobook_producer.tts import generate_tts, segment_paths
+    from audiobook_producer.music import generate_music
+    from audiobook_producer.effects import apply_segment_effects, load_segment_files
+    from audiobook_producer.assembly import assemble
+    from audiobook_producer.exporter import export
+
     _check_ffmpeg()
 
     slug = args.slug
@@ -219,11 +244,10 @@ def cmd_run(args):
     verbose = args.verbose
     force = args.force
 
-    # Load script.json
-    script = load_artifact(project_dir, "script.json")
-    cast_data = load_artifact(project_dir, "cast.json")
-    direction = load_artifact(project_dir, "direction.json")
-    effects_config = load_artifact(project_dir, "effects.json")
+    # Load project artifacts
+    script, cast_data, direction, effects_config = load_artifacts(
+        project_dir, ["script.json", "cast.json", "direction.json", "effects.json"],
+    )
 
     if not script or not cast_data:
         print(f"Error: Project '{slug}' is missing required artifacts.", file=sys.stderr)
@@ -251,7 +275,7 @@ def cmd_run(args):
 
     # Force mode: delete generated artifacts
     if force:
-        for subdir in ["voice_demos", "segments", "music", "samples", "chapters", "final"]:
+        for subdir in ["voice_demos", "tts_cache", "segments", "music", "samples", "chapters", "final"]:
             path = os.path.join(project_dir, subdir)
             if os.path.exists(path):
                 shutil.rmtree(path)
@@ -260,12 +284,17 @@ def cmd_run(args):
     # Step 1: Voice demos (verbose mode only generates them, always generated for -v)
     if verbose:
         demo_dir = os.path.join(project_dir, "voice_demos")
-        existing_demos = len([f for f in os.listdir(demo_dir) if f.endswith(".mp3")]) if os.path.exists(demo_dir) else 0
-        cast_fresh = check_step_fresh(project_dir, "voices", [os.path.join(project_dir, "cast.json")])
-
-        if not cast_fresh or existing_demos == 0 or force:
+        has_demos = _has_mp3(demo_dir)
+        cast_inputs = [os.path.join(project_dir, "cast.json")]
+        demos_fresh = check_step_fresh(project_dir, "voice_demos", cast_inputs)
+
+        if not demos_fresh or force:
+            if has_demos:
+                # Demos of the old cast; generate_voice_demos() keeps existing files
+                shutil.rmtree(demo_dir)
             print("Generating voice demos...")
             generate_voice_demos(project_dir, cast_data, segments)
+            record_step_inputs(project_dir, "voice_demos", cast_inputs)
         else:
             print("[skip] Voice demos: up to date")
 
@@ -276,29 +305,7 @@ def cmd_run(args):
             if response == "n":
                 print("Skipping preview, continuing to TTS...")
 
-    # Step 2: TTS generation
-    seg_dir = os.path.join(project_dir, "segments")
-    os.makedirs(seg_dir, exist_ok=True)
-    existing_mp3s = len([f for f in os.listdir(seg_dir) if f.endswith(".mp3")])
-
-    if existing_mp3s >= len(all_segments) and not force:
-        if verbose:
-            print("[skip] TTS: segments/ is up to date")
-    else:
-        print(f"Generating TTS for {len(all_segments)} segments...")
-        generate_tts(all_segments, seg_dir)
-
-    # Step 3: Effects
-    seg_dir = os.path.join(project_dir, "segments")
-    seg_files = sorted([f for f in os.listdir(seg_dir) if f.endswith(".mp3")])
-
-    # Load audio segments
-    audio_map = {}
-    for i, filename in enumerate(seg_files):
-        path = os.path.join(seg_dir, filename)
-        audio_map[f"{all_segments[i].type}_{i}"] = AudioSegment.from_mp3(path)
-
-    # Apply effects
+    # Step 2: Effects settings (applied as each TTS segment arrives)
     reverb_on = True
     normalize_on = True
     if effects_config:
@@ -314,34 +321,53 @@ def cmd_run(args):
             reverb_room = reverb_cfg.get("room_size", REVERB_ROOM_SIZE)
             reverb_wet = reverb_cfg.get("wet_level", REVERB_WET_LEVEL)
 
-    if verbose:
-        print("Applying effects...")
-    processed = process_segments(
-        all_segments, audio_map,
-        reverb=reverb_on, normalize=normalize_on,
-        reverb_room=reverb_room, reverb_wet=reverb_wet,
-        narrator_reverb_room=NARRATOR_REVERB_ROOM_SIZE,
-        narrator_reverb_wet=NARRATOR_REVERB_WET_LEVEL,
-    )
+    # Step 3: TTS generation, with effects applied once per new segment
+    seg_dir = os.path.join(project_dir, "segments")
+    os.makedirs(seg_dir, exist_ok=True)
+    seg_paths = segment_paths(all_segments, seg_dir)
+    cache_dir = os.path.join(seg_dir, ".cache")
 
-    # Save processed audio back
-    for i, filename in enumerate(seg_files):
-        key = f"{all_segments[i].type}_{i}"
-        if key in processed:
-            path = os.path.join(seg_dir, filename)
-            processed[key].export(path, format="mp3")
+    if not force and all(os.path.exists(p) for p in seg_paths):
+        if verbose:
+            print("[skip] TTS: segments/ is up to date")
+    else:
+        print(f"Generating TTS for {len(all_segments)} segments...")
+        generate_tts(
+            all_segments, seg_dir,
+            cache_dir=os.path.join(project_dir, "tts_cache"),
+            postprocess=functools.partial(
+                apply_segment_effects,
+                reverb=reverb_on, normalize=normalize_on,
+                reverb_room=reverb_room, reverb_wet=reverb_wet,
+                narrator_reverb_room=NARRATOR_REVERB_ROOM_SIZE,
+                narrator_reverb_wet=NARRATOR_REVERB_WET_LEVEL,
+                cache_dir=cache_dir,
+            ),
+        )
 
-    # Step 4: Music
     no_music = direction.get("no_music", False) if direction else False
+    bg_path = os.path.join(project_dir, "music", "background.mp3")
+    reuse_music = not no_music and not force and os.path.exists(bg_path)
+
+    # The background track is the longest single decode: run it alongside
+    # the segment decodes rather than after them
+    with ThreadPoolExecutor(max_workers=1) as music_loader:
+        music_future = None
+        if reuse_music:
+            music_future = music_loader.submit(
+                AudioSegment.from_file, bg_path, format="mp3", codec=MP3_DECODER,
+            )
+        processed_audio = load_segment_files(seg_paths, cache_dir=cache_dir)
+
+    # Step 4: Music
     music_audio = None
     music_source = None
 
     if not no_music:
-        bg_path = os.path.join(project_dir, "music", "background.mp3")
-        if os.path.exists(bg_path) and not force:
+        if music_future is not None:
             if verbose:
                 print("[skip] Music: background.mp3 exists")
-            music_audio = AudioSegment.from_mp3(bg_path)
+            music_audio = music_future.result()
             # Read source from direction.json
             if direction and direction.get("music_source"):
                 music_source = direction["music_source"]
@@ -360,25 +386,11 @@ def cmd_run(args):
         print("Assembling production...")
 
     # Split audio lists for intro/story/outro
-    intro_audio_list = []
-    story_audio_list = []
-    outro_audio_list = []
-
-    intro_count = len(intro_segments)
-    outro_count = len(outro_segments)
-    story_count = len(segments)
-
-    for i in range(intro_count):
-        key = f"{all_segments[i].type}_{i}"
-        intro_audio_list.append(processed.get(key, AudioSegment.silent(duration=100)))
-
-    for i in range(intro_count, intro_count + story_count):
-        key = f"{all_segments[i].type}_{i}"
-        story_audio_list.append(processed.get(key, AudioSegment.silent(duration=100)))
-
-    for i in range(intro_count + story_count, len(all_segments)):
-        key = f"{all_segments[i].type}_{i}"
-        outro_audio_list.append(processed.get(key, AudioSegment.silent(duration=100)))
+    intro_end = len(intro_segments)
+    story_end = intro_end + len(segments)
+    intro_audio_list = processed_audio[:intro_end]
+    story_audio_list = processed_audio[intro_end:story_end]
+    outro_audio_list = processed_audio[story_end:]
 
     music_bed_db = direction.get("music_bed_db", MUSIC_BED_DB) if direction else MUSIC_BED_DB
 
@@ -391,13 +403,21 @@ def cmd_run(args):
         music_bed_db=music_bed_db,
     )
 
-    # Generate preview
-    generate_preview(project_dir, assembled)
-
     # Step 6: Export
     if verbose:
         print("Exporting final MP3...")
 
+    # No-music fast path: stitch the processed segment MP3s directly so the
+    # final export is a remux rather than a full re-encode
+    prerendered = None
+    if no_music:
+        prerendered = _try_streamcopy(
+            project_dir,
+            seg_paths,
+            intro_segments, segments, outro_segments,
+            intro_audio_list + story_audio_list + outro_audio_list,
+        )
+
     settings = {
         "music": not no_music,
         "music_source": music_source,
@@ -405,23 +425,78 @@ def cmd_run(args):
         "reverb": reverb_on,
         "reverb_room_size": reverb_room,
         "reverb_wet_level": reverb_wet,
-        "bitrate": "192k",
     }
 
-    output_path = export(
-        assembled, project_dir, slug,
-        {**metadata, "source": script.get("source", "")},
-        cast_data,
-        settings,
-        len(segments),
-    )
-
-    # Chapter split
-    split_chapters(project_dir, assembled, segments)
+    try:
+        output_path = export(
+            assembled, project_dir, slug,
+            {**metadata, "source": script.get("source", "")},
+            cast_data,
+            settings,
+            len(segments),
+            prerendered=prerendered,
+        )
+    finally:
+        if prerendered:
+            os.remove(prerendered)
+
+    # Preview and chapters are cut from the exported MP3, not re-encoded
+    generate_preview(project_dir, assembled, source_mp3=output_path)
+    split_chapters(project_dir, assembled, segments, source_mp3=output_path)
 
     print(f"Done: {output_path}")
 
 
+def _has_mp3(directory: str) -> bool:
+    """True if directory holds at least one .mp3 (stops at the first)."""
+    try:
+        with os.scandir(directory) as it:
+            return any(entry.name.endswith(".mp3") for entry in it)
+    except FileNotFoundError:
+        return False
+
+
+def _try_streamcopy(
+    project_dir: str,
+    seg_paths: list[str],
+    intro_segments: list[Segment],
+    story_segments: list[Segment],
+    outro_segments: list[Segment],
+    audio: list["AudioSegment"],
+) -> str | None:
+    """Stitch segment MP3s without re-encoding; None if not possible.
+
+    Requires every segment to share one sample rate and channel layout.
+    Falls back (returns None) if a segment isn't a readable MP3 or
+    ffmpeg's concat demuxer fails.
+    """
+    from audiobook_producer.assembly import assemble_streamcopy
+
+    formats = {(a.frame_rate, a.channels) for a in audio}
+    if len(formats) != 1:
+        return None
+    frame_rate, channels = formats.pop()
+
+    intro_end = len(intro_segments)
+    story_end = intro_end + len(story_segments)
+    samples_dir = os.path.join(project_dir, "samples")
+    try:
+        # Pause silences are only needed for this one stitch
+        with tempfile.TemporaryDirectory() as silence_dir:
+            return assemble_streamcopy(
+                intro_segments, seg_paths[:intro_end],
+                story_segments, seg_paths[intro_end:story_end],
+                outro_segments, seg_paths[story_end:],
+                sample_counts=[int(a.frame_count()) for a in audio],
+                out_path=os.path.join(samples_dir, "_streamcopy.mp3"),
+                silence_dir=silence_dir,
+                frame_rate=frame_rate,
+                channels=channels,
+            )
+    except (subprocess.CalledProcessError, OSError, ValueError):
+        return None
+
+
 def _reconstruct_cast(cast_data: dict) -> dict:
     """Reconstruct cast dict format expected by assign_voices()."""
     result = {}
@@ -447,9 +522,8 @@ def cmd_status(args):
 
     if script:
         segments = script.get("segments", [])
-        narration = sum(1 for s in segments if s["type"] == "narration")
-        dialogue = sum(1 for s in segments if s["type"] == "dialogue")
-        print(f"Segments: {len(segments)} ({narration} narration, {dialogue} dialogue)")
+        counts = Counter(s["type"] for s in segments)
+        print(f"Segments: {len(segments)} ({counts['narration']} narration, {counts['dialogue']} dialogue)")
 
     if cast_data:
         print("Cast:")
@@ -546,6 +620,8 @@ def cmd_set(args):
         if not os.path.exists(music_path):
             print(f"Error: File not found: {music_path}", file=sys.stderr)
             raise SystemExit(1)
+        from audiobook_producer.music import load_and_prepare_music
+
         # Validate by loading — load_and_prepare_music will raise if corrupt
         target = os.path.join(project_dir, "music", "background.mp3")
         os.makedirs(os.path.dirname(target), exist_ok=True)
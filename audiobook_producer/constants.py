@@ -10,8 +10,10 @@ OUTRO_MUSIC_SOLO_MS = 4000          # music-only after "thank you" before final
 MUSIC_BED_DB = -25                  # music volume under intro/outro narration
 MUSIC_FADE_MS = 2000                # crossfade duration for music volume transitions
 OUTPUT_BITRATE = "192k"             # MP3 output bitrate
+MP3_DECODER = "mp3float"            # ffmpeg's default MP3 decoder; naming it skips pydub's ffprobe call
 TTS_RETRY_COUNT = 3                 # max retries per TTS segment
 TTS_RETRY_BASE_DELAY = 1.0         # seconds — base delay for exponential backoff
+TTS_MAX_CONCURRENCY = 8            # max TTS requests in flight at once
 TTS_RATE = "-10%"                            # speech rate: -10% = 10% slower than default
 NARRATOR_VOICE = "en-US-RogerNeural"         # narrator narration — deep, authoritative
 NARRATOR_DIALOGUE_VOICE = "en-GB-RyanNeural" # narrator spoken dialogue (British accent)
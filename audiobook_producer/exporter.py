@@ -1,12 +1,14 @@
 """Export assembled audio as MP3 with metadata tags."""
 
-import json
 import os
+import subprocess
 from datetime import datetime, timezone
 
 from pydub import AudioSegment
 
+from audiobook_producer.artifacts import write_artifact
 from audiobook_producer.constants import OUTPUT_BITRATE, VERSION
+from audiobook_producer.mp3 import bitrate_kbps, duration_ms as mp3_duration_ms
 
 
 def export(
@@ -17,6 +19,7 @@ def export(
     cast_data: dict,
     settings: dict,
     segment_count: int,
+    prerendered: str | None = None,
 ) -> str:
     """Export assembled audio as MP3 with metadata tags.
 
@@ -24,6 +27,11 @@ def export(
       - output/<slug>/final/<slug>.mp3 (the production)
       - output/<slug>/final/output.json (provenance manifest)
 
+    If prerendered is the path of an MP3 already encoded from the same
+    audio (see assembly.assemble_streamcopy), it is remuxed with the tags
+    instead of re-encoding `assembled`, and the manifest's duration and
+    bitrate are read from the remuxed file.
+
     Returns path to the final MP3 file.
     """
     final_dir = os.path.join(project_dir, "final")
@@ -38,12 +46,15 @@ def export(
     if metadata.get("author"):
         tags["artist"] = metadata["author"]
 
-    assembled.export(
-        output_path,
-        format="mp3",
-        bitrate=OUTPUT_BITRATE,
-        tags=tags,
-    )
+    if prerendered:
+        _remux_with_tags(prerendered, output_path, tags)
+        # The stitched file's length is its own, not the PCM assembly's
+        duration_ms = mp3_duration_ms(output_path)
+        bitrate = f"{bitrate_kbps(output_path)}k"
+    else:
+        _encode_with_tags(assembled, output_path, tags)
+        duration_ms = len(assembled)
+        bitrate = OUTPUT_BITRATE
 
     # Write output.json manifest
     manifest = {
@@ -56,16 +67,49 @@ def export(
             "author": metadata.get("author", ""),
         },
         "cast": cast_data,
-        "settings": settings,
+        "settings": {**settings, "bitrate": bitrate},
         "stats": {
             "segments": segment_count,
-            "duration_seconds": round(len(assembled) / 1000, 1),
+            "duration_seconds": round(duration_ms / 1000, 1),
             "characters": len([k for k in cast_data if k != "narrator"]),
         },
     }
 
-    manifest_path = os.path.join(final_dir, "output.json")
-    with open(manifest_path, "w") as f:
-        json.dump(manifest, f, indent=2)
+    write_artifact(final_dir, "output.json", manifest)
 
     return output_path
+
+
+# ffmpeg raw PCM formats by pydub sample width (pydub keeps 8-bit samples signed)
+_PCM_FORMATS = {1: "s8", 2: "s16le", 3: "s24le", 4: "s32le"}
+
+
+def _encode_with_tags(audio: AudioSegment, output_path: str, tags: dict) -> None:
+    """Encode audio to MP3 at OUTPUT_BITRATE, setting ID3 tags.
+
+    The PCM is piped straight into ffmpeg rather than going through
+    AudioSegment.export, which first writes a temporary WAV copy of the
+    whole production to disk.
+    """
+    cmd = [
+        AudioSegment.converter, "-y", "-loglevel", "error",
+        "-f", _PCM_FORMATS[audio.sample_width],
+        "-ar", str(audio.frame_rate),
+        "-ac", str(audio.channels),
+        "-i", "pipe:0",
+        "-codec:a", "libmp3lame",
+        "-b:a", OUTPUT_BITRATE,
+    ]
+    for key, value in tags.items():
+        cmd += ["-metadata", f"{key}={value}"]
+    cmd += ["-id3v2_version", "4", "-f", "mp3", output_path]
+    subprocess.run(cmd, input=audio.raw_data, check=True, capture_output=True)
+
+
+def _remux_with_tags(src_path: str, output_path: str, tags: dict) -> None:
+    """Copy an MP3's audio stream to output_path, setting ID3 tags."""
+    cmd = [AudioSegment.converter, "-y", "-loglevel", "error", "-i", src_path, "-c", "copy"]
+    for key, value in tags.items():
+        cmd += ["-metadata", f"{key}={value}"]
+    cmd += ["-id3v2_version", "4", output_path]
+    subprocess.run(cmd, check=True, capture_output=True)
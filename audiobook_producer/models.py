@@ -3,9 +3,16 @@
 from dataclasses import dataclass
 
 
-@dataclass
+# slots: books run to tens of thousands of segments, so no per-instance __dict__
+@dataclass(slots=True)
 class Segment:
     type: str          # "narration" or "dialogue"
     text: str
     speaker: str       # "narrator", character name, or "unknown"
     voice: str = ""    # populated by assign_voices()
+
+
+@dataclass
+class PreviewResult:
+    path: str          # samples/preview_60s.mp3
+    duration_ms: int   # length of the clip, capped at the story's length
@@ -0,0 +1,110 @@
+"""MP3 frame-level inspection: lengths read from frame headers, no decoding."""
+
+import mmap
+
+# Layer III bitrates (kbps) by header index, for MPEG-1 and MPEG-2/2.5
+_BITRATES = {
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates by header version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+
+def _id3v2_size(buf) -> int:
+    """Bytes taken by a leading ID3v2 tag (0 if there is none)."""
+    if len(buf) < 10 or buf[:3] != b"ID3":
+        return 0
+    # Tag size is four 7-bit bytes, excluding the 10-byte header
+    size = (buf[6] << 21) | (buf[7] << 14) | (buf[8] << 7) | buf[9]
+    footer = 10 if buf[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _is_info_frame(buf, pos: int, mpeg1: bool, mono: bool) -> bool:
+    """True if the frame at pos is a Xing/Info/VBRI header rather than audio."""
+    side_info = (17 if mono else 32) if mpeg1 else (9 if mono else 17)
+    tag = buf[pos + 4 + side_info:pos + 8 + side_info]
+    return tag in (b"Xing", b"Info") or buf[pos + 36:pos + 40] == b"VBRI"
+
+
+def _scan_frames(path: str) -> tuple[int, int, int, int]:
+    """Return (audio frames, samples per frame, sample rate, audio bytes).
+
+    Walks the Layer III frame headers, skipping ID3v2 tags and the
+    Xing/Info header frame, and stops at trailing tags or a truncated
+    frame.
+
+    Raises ValueError if the file holds no Layer III frames.
+    """
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            raise ValueError(f"No MP3 frames in {path}") from None
+    with buf:
+        size = len(buf)
+        pos = _id3v2_size(buf)
+        frames = audio_bytes = 0
+        samples_per_frame = frame_rate = 0
+        first = True
+        while pos + 4 <= size:
+            b1, b2, b3 = buf[pos + 1], buf[pos + 2], buf[pos + 3]
+            version = (b1 >> 3) & 0x03
+            bitrate_idx = b2 >> 4
+            rate_idx = (b2 >> 2) & 0x03
+            if (
+                buf[pos] != 0xFF or b1 & 0xE0 != 0xE0
+                or version == 1 or (b1 >> 1) & 0x03 != 1  # reserved / not Layer III
+                or bitrate_idx in (0, 15) or rate_idx == 3
+            ):
+                break
+            mpeg1 = version == 3
+            frame_rate = _SAMPLE_RATES[version][rate_idx]
+            bitrate = _BITRATES[1 if mpeg1 else 2][bitrate_idx] * 1000
+            length = (144 if mpeg1 else 72) * bitrate // frame_rate + ((b2 >> 1) & 0x01)
+            if pos + length > size:
+                break
+            samples_per_frame = 1152 if mpeg1 else 576
+            if not (first and _is_info_frame(buf, pos, mpeg1, (b3 >> 6) == 3)):
+                frames += 1
+                audio_bytes += length
+            first = False
+            pos += length
+
+    if frames == 0:
+        raise ValueError(f"No MP3 frames in {path}")
+    return frames, samples_per_frame, frame_rate, audio_bytes
+
+
+def stream_samples(path: str) -> tuple[int, int]:
+    """Return (samples per channel, sample rate) of an MP3's audio frames.
+
+    The count includes encoder delay and end padding, which gapless-aware
+    decoders trim from the first and last file of a stream (under 0.1 s
+    in total).
+
+    Raises ValueError if the file holds no Layer III frames.
+    """
+    frames, samples_per_frame, frame_rate, _ = _scan_frames(path)
+    return frames * samples_per_frame, frame_rate
+
+
+def bitrate_kbps(path: str) -> int:
+    """Average bitrate of an MP3's audio frames in kbps, from their headers.
+
+    Files stitched from differently encoded MP3s mix frame bitrates; this
+    is their mean over the stream's length.
+    """
+    frames, samples_per_frame, frame_rate, audio_bytes = _scan_frames(path)
+    return round(audio_bytes * 8 * frame_rate / (frames * samples_per_frame) / 1000)
+
+
+def duration_ms(path: str) -> int:
+    """Length of an MP3 in milliseconds, from its frame headers."""
+    samples, frame_rate = stream_samples(path)
+    return round(samples * 1000 / frame_rate)
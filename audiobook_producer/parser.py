@@ -24,26 +24,48 @@ SPEECH_VERBS = (
 # Build regex alternation from speech verbs
 _VERB_PATTERN = "|".join(re.escape(v) for v in SPEECH_VERBS)
 
-# Post-attribution: "Hello," said John. / "Hello," I cried.
-_POST_ATTR_RE = re.compile(
-    rf'"([^"]+)"\s*[,.]?\s*(?:{_VERB_PATTERN})\s+(I|[A-Za-z][\w\s.]*?)(?:\s*[,;.\-—!?]|$)',
+# Longest speaker name pre-attribution looks for before the verb ("the
+# bearer of the white mackintosh"). Without a bound, every word start in
+# a long run of narration rescans the rest of the run for a verb, which is
+# quadratic in paragraph length. _speaker_start() recovers the rest of a
+# longer name once a match is found.
+_MAX_SPEAKER_WORDS = 6
+
+# Attributed dialogue, as named alternatives of one pattern so a paragraph
+# is scanned once. Alternatives are tried in order at each position, so
+# first-person wins over post-attribution where both match; a pre match
+# whose quote is also post-attributed gives way to the post match.
+#   fpost: "Stop!" I cried. (verb before speaker)
+#   post:  "Hello," said John. / "Hello," I cried.
+#   pre:   John said, "Hello." / the old man cried out, "Hello."
+_ATTRIBUTED_RE = re.compile(
+    rf'(?P<fpost>"(?P<fpost_quote>[^"]+)"\s*[,.]?\s*(?P<fpost_speaker>I)\s+(?:{_VERB_PATTERN})(?:\s*[,;.\-—!?]|$))'
+    rf'|(?P<post>"(?P<post_quote>[^"]+)"\s*[,.]?\s*(?:{_VERB_PATTERN})\s+(?P<post_speaker>I|[A-Za-z][\w\s.]*?)(?:\s*[,;.\-—!?]|$))'
+    rf'|(?P<pre>(?P<pre_speaker>\b\w[\w.]*(?:\s+[\w.]+){{0,{_MAX_SPEAKER_WORDS - 1}}}?)\s+(?:{_VERB_PATTERN})(?:\s+\w+){{0,3}}\s*[,:]?\s*(?:--|—)?\s*"(?P<pre_quote>[^"]+)")',
     re.IGNORECASE,
 )
 
-# First-person post-attribution: "Stop!" I cried. (verb before speaker)
-_FIRST_PERSON_POST_RE = re.compile(
-    rf'"([^"]+)"\s*[,.]?\s*(I)\s+(?:{_VERB_PATTERN})(?:\s*[,;.\-—!?]|$)',
+# Characters that end the clause a pre-attributed speaker phrase starts in
+_CLAUSE_PUNCTUATION = '.!?,;:"—'
+
+# Standalone dialogue with no attribution
+_DIALOGUE_RE = re.compile(r'"([^"]+)"')
+
+# Speech-verb attribution left around dialogue once the quote is cut out:
+# 'John said, ' before it / 'said John.' after it
+_TRAILING_ATTR_RE = re.compile(
+    rf'\s*(?:{_VERB_PATTERN})\s*[,:]?\s*(?:--|—)?\s*$',
     re.IGNORECASE,
 )
-
-# Pre-attribution: John said, "Hello." / the old man cried out, "Hello."
-_PRE_ATTR_RE = re.compile(
-    rf'([\w][\w\s.]*?)\s+(?:{_VERB_PATTERN})(?:\s+\w+){{0,3}}\s*[,:]?\s*(?:--|—)?\s*"([^"]+)"',
+_LEADING_ATTR_RE = re.compile(
+    rf'^\s*(?:{_VERB_PATTERN})\s+\w[\w\s.]*?[,;.!?—-]*\s*',
     re.IGNORECASE,
 )
 
-# Standalone dialogue with no attribution
-_DIALOGUE_RE = re.compile(r'"([^"]+)"')
+# Structure: paragraph breaks, sentence ends, "by Author" lines
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n\s*\n")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_BY_LINE_RE = re.compile(r"^by\s+(.+)$", re.IGNORECASE)
 
 # First-person pronouns that map to narrator
 _FIRST_PERSON = {"i", "we"}
@@ -63,7 +85,7 @@ def extract_metadata(text: str) -> tuple[str, str]:
     has_by_line = False
     for line in lines:
         stripped = line.strip()
-        match = re.match(r"^by\s+(.+)$", stripped, re.IGNORECASE)
+        match = _BY_LINE_RE.match(stripped)
         if match:
             author = match.group(1).strip()
             has_by_line = True
@@ -77,9 +99,12 @@ def extract_metadata(text: str) -> tuple[str, str]:
     return title, author
 
 
-def _strip_metadata_header(text: str) -> str:
-    """Remove title and author lines from the beginning of the text."""
-    paragraphs = re.split(r"\n\s*\n", text.strip())
+def _metadata_header_length(paragraphs: list[str]) -> int:
+    """Number of leading paragraphs that are the title and author lines.
+
+    Works on the story's paragraph list, so the body is split once and
+    never rejoined; only the leading paragraphs are examined.
+    """
     # Skip paragraphs that are the title or "by Author" line
     start_idx = 0
     for i, para in enumerate(paragraphs):
@@ -93,7 +118,7 @@ def _strip_metadata_header(text: str) -> str:
             line = line.strip()
             if not line:
                 continue
-            if re.match(r"^by\s+", line, re.IGNORECASE):
+            if _BY_LINE_RE.match(line):
                 continue
             # Could be the title (short single line at start)
             if i == 0 and len(lines) <= 2:
@@ -104,7 +129,7 @@ def _strip_metadata_header(text: str) -> str:
             start_idx = i + 1
         else:
             break
-    return "\n\n".join(paragraphs[start_idx:])
+    return start_idx
 
 
 def _normalize_speaker(name: str) -> str:
@@ -122,7 +147,7 @@ def _split_long_segment(text: str, threshold: int = SEGMENT_SPLIT_THRESHOLD) ->
         return [text]
 
     # Split at sentence boundaries
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     chunks = []
     current = ""
 
@@ -139,6 +164,21 @@ def _split_long_segment(text: str, threshold: int = SEGMENT_SPLIT_THRESHOLD) ->
     return chunks if chunks else [text]
 
 
+def _speaker_start(text: str, lo: int, start: int) -> int:
+    """Where a pre-attributed speaker phrase found at start really begins.
+
+    The pattern looks at most _MAX_SPEAKER_WORDS back from the verb, so a
+    longer phrase ("the bearer of the large white mackintosh") is cut short.
+    Walk back to the start of the clause, no further than lo, so its leading
+    words stay with the speaker instead of being left behind as narration.
+    """
+    clause = max(text.rfind(c, lo, start) for c in _CLAUSE_PUNCTUATION) + 1
+    clause = max(clause, lo)
+    while clause < start and text[clause].isspace():
+        clause += 1
+    return clause
+
+
 def _extract_from_paragraph(paragraph: str) -> list[Segment]:
     """Extract segments (narration + dialogue) from a single paragraph."""
     segments = []
@@ -146,43 +186,29 @@ def _extract_from_paragraph(paragraph: str) -> list[Segment]:
     if not text:
         return segments
 
-    # Track which character ranges are dialogue
+    # Track which character ranges are dialogue. Each search resumes where
+    # the last match ended, so the ranges come out disjoint and in order.
     dialogue_ranges = []
-
-    # Try first-person post-attribution: "Stop!" I cried.
-    for match in _FIRST_PERSON_POST_RE.finditer(text):
-        quote_text = match.group(1).strip()
-        speaker = _normalize_speaker(match.group(2))
-        if quote_text:
-            dialogue_ranges.append((match.start(), match.end(), quote_text, speaker))
-
-    # Try post-attribution: "Hello," said John.
-    for match in _POST_ATTR_RE.finditer(text):
-        quote_text = match.group(1).strip()
-        speaker = _normalize_speaker(match.group(2))
-        if quote_text:
-            # Check for overlap with existing ranges
-            overlap = False
-            for start, end, _, _ in dialogue_ranges:
-                if not (match.end() <= start or match.start() >= end):
-                    overlap = True
-                    break
-            if not overlap:
-                dialogue_ranges.append((match.start(), match.end(), quote_text, speaker))
-
-    # Try pre-attribution: John said, "Hello."
-    for match in _PRE_ATTR_RE.finditer(text):
-        speaker = _normalize_speaker(match.group(1))
-        quote_text = match.group(2).strip()
+    pos = 0
+    while (match := _ATTRIBUTED_RE.search(text, pos)):
+        start = match.start()
+        if match.lastgroup == "pre":
+            # A quote with its own attribution after it belongs to that
+            # speaker: 'John said, "Hello," said Mary.' is Mary's line.
+            post = _ATTRIBUTED_RE.match(text, match.start("pre_quote") - 1)
+            if post:
+                match, start = post, post.start()
+            else:
+                start = _speaker_start(text, pos, start)
+        kind = match.lastgroup
+        quote_text = match.group(f"{kind}_quote").strip()
         if quote_text:
-            # Check for overlap with existing ranges
-            overlap = False
-            for start, end, _, _ in dialogue_ranges:
-                if not (match.end() <= start or match.start() >= end):
-                    overlap = True
-                    break
-            if not overlap:
-                dialogue_ranges.append((match.start(), match.end(), quote_text, speaker))
+            if kind == "pre":
+                speaker = text[start:match.end("pre_speaker")]
+            else:
+                speaker = match.group(f"{kind}_speaker")
+            dialogue_ranges.append((start, match.end(), quote_text, _normalize_speaker(speaker)))
+        pos = match.end()
 
     # If no attributed dialogue found, look for standalone quotes
     if not dialogue_ranges:
@@ -197,16 +223,13 @@ def _extract_from_paragraph(paragraph: str) -> list[Segment]:
             segments.append(Segment(type="narration", text=chunk, speaker="narrator"))
         return segments
 
-    # Sort by position
-    dialogue_ranges.sort(key=lambda x: x[0])
-
     # Extract narration between dialogue blocks
     pos = 0
     for start, end, quote_text, speaker in dialogue_ranges:
         # Narration before this dialogue
         before = text[pos:start].strip()
         # Remove trailing attribution words from narration
-        before = re.sub(rf'\s*(?:{_VERB_PATTERN})\s*[,:]?\s*(?:--|—)?\s*$', '', before, flags=re.IGNORECASE).strip()
+        before = _TRAILING_ATTR_RE.sub('', before).strip()
         before = before.rstrip(".,;:!?—- ").strip()
         if before:
             for chunk in _split_long_segment(before):
@@ -222,7 +245,7 @@ def _extract_from_paragraph(paragraph: str) -> list[Segment]:
     after = text[pos:].strip()
     if after:
         # Clean up leftover attribution words
-        after = re.sub(rf'^\s*(?:{_VERB_PATTERN})\s+\w[\w\s.]*?[,;.!?—-]*\s*', '', after, flags=re.IGNORECASE).strip()
+        after = _LEADING_ATTR_RE.sub('', after).strip()
         if after:
             for chunk in _split_long_segment(after):
                 segments.append(Segment(type="narration", text=chunk, speaker="narrator"))
@@ -236,11 +259,10 @@ def parse_story(text: str) -> list[Segment]:
     Strips the metadata header (title + author), then splits on paragraph
     boundaries and extracts dialogue with speaker attribution.
     """
-    body = _strip_metadata_header(text)
-    paragraphs = re.split(r"\n\s*\n", body)
+    paragraphs = _PARAGRAPH_SPLIT_RE.split(text.strip())
 
     all_segments = []
-    for para in paragraphs:
+    for para in paragraphs[_metadata_header_length(paragraphs):]:
         para = para.strip()
         if not para:
             continue
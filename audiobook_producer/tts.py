@@ -1,12 +1,22 @@
 """TTS generation via edge-tts with retry logic."""
 
 import asyncio
+import contextlib
+import hashlib
 import os
-import time
+import shutil
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
 import edge_tts
 
-from audiobook_producer.constants import TTS_RETRY_COUNT, TTS_RETRY_BASE_DELAY, TTS_RATE
+from audiobook_producer.constants import (
+    TTS_RETRY_COUNT,
+    TTS_RETRY_BASE_DELAY,
+    TTS_RATE,
+    TTS_MAX_CONCURRENCY,
+)
 from audiobook_producer.models import Segment
 
 
@@ -16,11 +26,27 @@ def generate_single(text: str, voice: str, output_path: str, rate: str = TTS_RAT
     Sync wrapper around edge_tts.Communicate(). Retries on network errors,
     HTTP errors, or 0-byte output files. Rate is a relative string like "-10%".
     """
+    asyncio.run(generate_single_async(text, voice, output_path, rate=rate))
+
+
+async def generate_single_async(
+    text: str,
+    voice: str,
+    output_path: str,
+    rate: str = TTS_RATE,
+    limit: asyncio.Semaphore | None = None,
+) -> None:
+    """Async form of generate_single(), for running many requests concurrently.
+
+    If limit is given, it is held for each attempt only, so a request
+    waiting out its retry backoff doesn't occupy a concurrency slot.
+    """
     last_error = None
     for attempt in range(TTS_RETRY_COUNT):
         try:
-            communicate = edge_tts.Communicate(text, voice, rate=rate)
-            asyncio.run(communicate.save(output_path))
+            async with limit or contextlib.nullcontext():
+                communicate = edge_tts.Communicate(text, voice, rate=rate)
+                await communicate.save(output_path)
 
             # Validate output: 0-byte file counts as failure
             if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
@@ -34,7 +60,7 @@ def generate_single(text: str, voice: str, output_path: str, rate: str = TTS_RAT
         # Exponential backoff
         if attempt < TTS_RETRY_COUNT - 1:
             delay = TTS_RETRY_BASE_DELAY * (2 ** attempt)
-            time.sleep(delay)
+            await asyncio.sleep(delay)
 
     raise last_error
 
@@ -46,26 +72,138 @@ def _segment_filename(index: int, segment: Segment) -> str:
     return f"{index:03d}_{segment.type}_{speaker_slug}.mp3"
 
 
-def generate_tts(segments: list[Segment], output_dir: str, rate: str = TTS_RATE) -> list[str]:
+def segment_paths(segments: list[Segment], output_dir: str) -> list[str]:
+    """Output path for each segment, in segment order.
+
+    Names are derived from the segment index, so callers can check or load
+    specific files without listing and sorting the directory.
+    """
+    return [
+        os.path.join(output_dir, _segment_filename(i, seg))
+        for i, seg in enumerate(segments)
+    ]
+
+
+def _tts_key(text: str, voice: str, rate: str) -> str:
+    """Content address of a TTS request: same key, same audio."""
+    return hashlib.blake2b(f"{voice}|{rate}|{text}".encode(), digest_size=16).hexdigest()
+
+
+def generate_tts(
+    segments: list[Segment],
+    output_dir: str,
+    rate: str = TTS_RATE,
+    concurrency: int = TTS_MAX_CONCURRENCY,
+    postprocess: Callable[[str, str], None] | None = None,
+    max_workers: int | None = None,
+    cache_dir: str | None = None,
+) -> list[str]:
     """Generate TTS for all segments.
 
+    Up to `concurrency` requests are in flight at once. A failed segment
+    doesn't cancel the others; once all have finished, the first error is
+    re-raised (completed files stay on disk for the next run).
+
+    Segments with identical text, voice and rate share one request. With
+    cache_dir, the raw downloads are also kept there, keyed by content,
+    so a later run (e.g. after an effects change cleared output_dir)
+    only requests text it hasn't seen; entries no current segment uses
+    are removed.
+
+    postprocess(path, segment_type), if given, runs on each newly generated
+    file in a pool of max_workers threads as soon as its download finishes,
+    overlapping with the requests still in flight. A file only gets its
+    final name once postprocess has returned, so an interrupted run never
+    leaves an unprocessed segment behind to be skipped next time.
+
     Returns list of output file paths. Prints progress counter.
     """
+    with contextlib.ExitStack() as stack:
+        if cache_dir is None:
+            raw_dir = stack.enter_context(
+                tempfile.TemporaryDirectory(dir=output_dir, prefix=".tts_")
+            )
+        else:
+            os.makedirs(cache_dir, exist_ok=True)
+            raw_dir = cache_dir
+        pool = None
+        if postprocess is not None:
+            pool = stack.enter_context(
+                ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1)
+            )
+        paths = asyncio.run(_generate_batch(
+            segments, output_dir, rate, concurrency, raw_dir, postprocess, pool,
+        ))
+
+    if cache_dir is not None:
+        _prune_cache(cache_dir, {_tts_key(s.text, s.voice, rate) for s in segments})
+    return paths
+
+
+def _prune_cache(cache_dir: str, keep: set[str]) -> None:
+    """Remove cached downloads (and stray partial files) not in keep."""
+    with os.scandir(cache_dir) as it:
+        stale = [e.path for e in it if e.name.removesuffix(".mp3") not in keep]
+    for path in stale:
+        os.remove(path)
+
+
+async def _generate_batch(
+    segments: list[Segment],
+    output_dir: str,
+    rate: str,
+    concurrency: int,
+    raw_dir: str,
+    postprocess: Callable[[str, str], None] | None = None,
+    pool: ThreadPoolExecutor | None = None,
+) -> list[str]:
+    """Run all segment requests through a bounded semaphore."""
     total = len(segments)
     paths = []
-
-    for i, seg in enumerate(segments):
-        filename = _segment_filename(i, seg)
-        output_path = os.path.join(output_dir, filename)
+    pending = []
+    downloads: dict[str, asyncio.Task] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+
+    async def download(key: str, text: str, voice: str) -> str:
+        raw_path = os.path.join(raw_dir, f"{key}.mp3")
+        if os.path.exists(raw_path) and os.path.getsize(raw_path) > 0:
+            return raw_path
+        await generate_single_async(
+            text, voice, f"{raw_path}.part", rate=rate, limit=semaphore,
+        )
+        os.replace(f"{raw_path}.part", raw_path)
+        return raw_path
+
+    async def generate(i: int, seg: Segment, filename: str, output_path: str) -> None:
+        key = _tts_key(seg.text, seg.voice, rate)
+        if key not in downloads:
+            downloads[key] = asyncio.ensure_future(download(key, seg.text, seg.voice))
+        raw_path = await downloads[key]
+
+        # A copy, not a link: postprocess rewrites the file in place
+        part_path = f"{output_path}.part"
+        shutil.copyfile(raw_path, part_path)
+        if postprocess is not None:
+            await loop.run_in_executor(pool, postprocess, part_path, seg.type)
+        os.replace(part_path, output_path)
+        # Reported on completion: with requests in flight, start order says little
+        print(f"  Generated segment {i + 1}/{total}: {filename}")
+
+    for i, (seg, output_path) in enumerate(zip(segments, segment_paths(segments, output_dir))):
+        filename = os.path.basename(output_path)
+        paths.append(output_path)
 
         # Skip if already exists (resumability)
         if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
             print(f"  [skip] Segment {i + 1}/{total}: {filename}")
-            paths.append(output_path)
             continue
 
-        print(f"  Generating segment {i + 1}/{total}: {filename}")
-        generate_single(seg.text, seg.voice, output_path, rate=rate)
-        paths.append(output_path)
+        pending.append(generate(i, seg, filename, output_path))
+
+    results = await asyncio.gather(*pending, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
 
     return paths
@@ -4,10 +4,19 @@ import hashlib
 import json
 import logging
 import os
+from functools import lru_cache
 
 from audiobook_producer.models import Segment
 from audiobook_producer.constants import NARRATOR_VOICE, NARRATOR_DIALOGUE_VOICE
 
+# Try to import orjson — faster parse of large cast sidecars; fall back to
+# the stdlib json module if not installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Hardcoded English voice pool (avoids network call at startup).
@@ -40,25 +49,31 @@ def load_cast(story_path: str) -> dict:
     if not os.path.exists(cast_path):
         return {}
     try:
-        with open(cast_path) as f:
-            return json.load(f)
-    except json.JSONDecodeError:
+        with open(cast_path, "rb") as f:
+            raw = f.read()
+        if ORJSON_AVAILABLE:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
         logger.warning("Malformed cast file: %s — using hash fallback", cast_path)
         return {}
 
 
-def _resolve_alias(speaker: str, cast: dict) -> str:
-    """Resolve a speaker name through alias mappings in cast data."""
-    cast_entries = cast.get("cast", {})
+def _alias_map(cast_entries: dict) -> dict[str, str]:
+    """Lowercased alias → lowercased primary name; the first cast entry wins."""
+    aliases = {}
     for primary_name, info in cast_entries.items():
-        aliases = info.get("aliases", [])
-        if speaker.lower() in [a.lower() for a in aliases]:
-            return primary_name.lower()
-    return speaker.lower()
+        for alias in info.get("aliases", []):
+            aliases.setdefault(alias.lower(), primary_name.lower())
+    return aliases
+
 
+@lru_cache(maxsize=1024)
+def _hash_voice(speaker: str, pool: tuple[str, ...]) -> str:
+    """Deterministic voice assignment via sha256 hash.
 
-def _hash_voice(speaker: str, pool: list[str]) -> str:
-    """Deterministic voice assignment via sha256 hash."""
+    Cached, as the same few speakers come up in every assign_voices() call.
+    """
     h = hashlib.sha256(speaker.encode()).hexdigest()
     idx = int(h, 16) % len(pool)
     return pool[idx]
@@ -84,36 +99,58 @@ def assign_voices(segments: list[Segment], cast: dict | None = None) -> None:
         if "voice" in info:
             used_voices.add(info["voice"])
 
-    available_pool = [v for v in VOICE_POOL if v not in used_voices]
+    available_pool = tuple(v for v in VOICE_POOL if v not in used_voices)
     if not available_pool:
-        available_pool = list(VOICE_POOL)  # fallback to full pool if all taken
-
+        available_pool = tuple(VOICE_POOL)  # fallback to full pool if all taken
+
+    # Lookup tables built once; a speaker's voice is resolved on first sight
+    alias_to_primary = _alias_map(cast_entries)
+    primary_to_voice = {}
+    for name, info in cast_entries.items():
+        primary_to_voice.setdefault(name.lower(), info.get("voice"))
+    speaker_voices: dict[str, str] = {}
+    narrator_voices = {"narration": narrator_voice, "dialogue": narrator_dialogue_voice}
+
+    # Memo keyed on the speaker as written, so each distinct spelling is
+    # lowercased once; narrator segments (the parser's "narrator") skip it
     for seg in segments:
-        speaker = seg.speaker.lower()
+        speaker = seg.speaker
 
         # 1. Narrator rules
         if speaker == "narrator":
-            if seg.type == "dialogue":
-                seg.voice = narrator_dialogue_voice
-            else:
-                seg.voice = narrator_voice
+            seg.voice = narrator_voices.get(seg.type, narrator_voice)
             continue
 
-        # 2. Resolve aliases
-        resolved = _resolve_alias(speaker, cast)
+        voice = speaker_voices.get(speaker)
+        if voice is None:
+            key = speaker.lower()
+            if key == "narrator":
+                seg.voice = narrator_voices.get(seg.type, narrator_voice)
+                continue
 
-        # 3. Cast file lookup
-        cast_voice = None
-        for name, info in cast_entries.items():
-            if name.lower() == resolved:
-                cast_voice = info.get("voice")
-                break
+            # 2. Resolve aliases
+            resolved = alias_to_primary.get(key, key)
+
+            # 3. Cast file lookup, 4. hash fallback
+            voice = primary_to_voice.get(resolved) or _hash_voice(resolved, available_pool)
+            speaker_voices[speaker] = voice
+        seg.voice = voice
+
+
+# Speakers that are not characters, left out of the intro and outro credits
+_NON_CHARACTER_SPEAKERS = frozenset({"narrator", "unknown"})
 
-        if cast_voice:
-            seg.voice = cast_voice
-        else:
-            # 4. Hash fallback
-            seg.voice = _hash_voice(resolved, available_pool)
+
+def _first_appearances(segments: list[Segment]) -> list[Segment]:
+    """First segment of each character (case-insensitive), in story order."""
+    seen = set(_NON_CHARACTER_SPEAKERS)
+    firsts = []
+    for seg in segments:
+        speaker = seg.speaker.lower()
+        if speaker not in seen:
+            seen.add(speaker)
+            firsts.append(seg)
+    return firsts
 
 
 def generate_intro_segments(
@@ -150,16 +187,14 @@ def generate_intro_segments(
     ))
 
     # Collect unique characters (excluding narrator and unknown)
-    seen = set()
-    characters = []
-    for seg in segments:
-        speaker = seg.speaker.lower()
-        if speaker in ("narrator", "unknown") or speaker in seen:
-            continue
-        seen.add(speaker)
-        characters.append((seg.speaker, seg.voice))
+    characters = [(seg.speaker, seg.voice) for seg in _first_appearances(segments)]
 
     if characters:
+        # Lowercased name → description, built once; the first cast entry wins
+        descriptions = {}
+        for name, info in cast_entries.items():
+            descriptions.setdefault(name.lower(), info.get("description", ""))
+
         intro.append(Segment(
             type="narration",
             text="The characters will be...",
@@ -178,12 +213,7 @@ def generate_intro_segments(
             ))
 
             # Narrator describes the character
-            description = ""
-            for name, info in cast_entries.items():
-                if name.lower() == speaker_name.lower():
-                    description = info.get("description", "")
-                    break
-
+            description = descriptions.get(speaker_name.lower(), "")
             if description:
                 intro.append(Segment(
                     type="narration",
@@ -249,14 +279,7 @@ def generate_outro_segments(
     ))
 
     # Character list
-    seen = set()
-    char_names = []
-    for seg in segments:
-        speaker = seg.speaker.lower()
-        if speaker in ("narrator", "unknown") or speaker in seen:
-            continue
-        seen.add(speaker)
-        char_names.append(seg.speaker.title())
+    char_names = [seg.speaker.title() for seg in _first_appearances(segments)]
 
     if char_names:
         if len(char_names) == 1:
@@ -1,20 +1,104 @@
 """Shared fixtures for audiobook producer tests."""
 
+import functools
+import io
+import os
+import shutil
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
 from pydub import AudioSegment
 
+from audiobook_producer.artifacts import init_output_dir
 from audiobook_producer.models import Segment
 
 
+@pytest.fixture(autouse=True)
+def output_dir(tmp_path, monkeypatch):
+    """Point OUTPUT_DIR at tmp_path/output so no test touches the real output/."""
+    out = str(tmp_path / "output")
+    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", out)
+    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", out)
+    return out
+
+
+@pytest.fixture(autouse=True)
+def ffmpeg_on_path(monkeypatch):
+    """Make the CLI's ffmpeg check pass; other shutil.which lookups are real.
+
+    Tests of the missing-ffmpeg path override this with their own
+    monkeypatch.setattr(shutil, "which", ...).
+    """
+    which = shutil.which
+
+    def fake_which(name, *args, **kwargs):
+        if name == "ffmpeg":
+            return "/usr/bin/ffmpeg"
+        return which(name, *args, **kwargs)
+
+    monkeypatch.setattr(shutil, "which", fake_which)
+
+
+@pytest.fixture(scope="session")
+def silent_mp3(request):
+    """silent_mp3(duration_ms, frame_rate=44100) -> bytes of a silent MP3.
+
+    Each duration/rate is encoded once and kept in pytest's cache
+    directory (.pytest_cache), so later runs and xdist workers read the
+    file instead of running ffmpeg; `pytest --cache-clear` re-encodes.
+    With the cache plugin off (-p no:cacheprovider) clips are only kept
+    in memory for the session.
+    """
+    cache = getattr(request.config, "cache", None)
+    cache_dir = cache.mkdir("silent_mp3") if cache is not None else None
+
+    @functools.cache
+    def encode(duration_ms: int, frame_rate: int = 44100) -> bytes:
+        path = cache_dir and cache_dir / f"{duration_ms}ms_{frame_rate}hz.mp3"
+        if path and path.exists():
+            return path.read_bytes()
+        buf = io.BytesIO()
+        AudioSegment.silent(duration=duration_ms, frame_rate=frame_rate).export(buf, format="mp3")
+        if path:
+            # Workers may encode the same clip at once; publish it atomically
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(buf.getvalue())
+            os.replace(tmp, path)
+        return buf.getvalue()
+    return encode
+
+
+@pytest.fixture
+def mock_communicate(silent_mp3):
+    """Patch edge_tts.Communicate so every request saves a 100ms silent MP3.
+
+    Yields the mock, for tests that count TTS requests.
+    """
+    def factory(text, voice, **kwargs):
+        async def save(path):
+            with open(path, "wb") as f:
+                f.write(silent_mp3(100))
+        return SimpleNamespace(save=save)
+
+    with patch("audiobook_producer.tts.edge_tts.Communicate", side_effect=factory) as mock_comm:
+        yield mock_comm
+
+
 @pytest.fixture
-def tiny_mp3(tmp_path):
-    """Generate a 100ms silent MP3 for testing."""
+def tiny_mp3(tmp_path, silent_mp3):
+    """A 100ms silent MP3 for testing, written fresh into tmp_path."""
     path = tmp_path / "test.mp3"
-    silence = AudioSegment.silent(duration=100)
-    silence.export(str(path), format="mp3")
+    path.write_bytes(silent_mp3(100))
     return path
 
 
+@pytest.fixture
+def project_dir(tmp_path):
+    """An empty project with the standard subdirectories, as `new` creates it."""
+    return init_output_dir(str(tmp_path / "story.txt"), output_base=str(tmp_path))
+
+
 @pytest.fixture
 def sample_segments():
     """Pre-built segments for voice/assembly/integration tests."""
@@ -2,7 +2,7 @@
 
 import json
 import os
-import time
+from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
@@ -14,6 +14,7 @@ from audiobook_producer.artifacts import (
     slug_from_path,
     write_artifact,
     load_artifact,
+    load_artifacts,
     invalidate_downstream,
     get_project_status,
     list_projects,
@@ -21,7 +22,14 @@ from audiobook_producer.artifacts import (
     generate_preview,
     split_chapters,
     check_step_fresh,
+    record_step_inputs,
 )
+from audiobook_producer.constants import MP3_DECODER
+
+
+def _set_mtime(path, t):
+    """Pin a file's mtime (and atime) to t, for deterministic freshness checks."""
+    os.utime(path, (t, t))
 
 
 # --- Directory and file management ---
@@ -41,8 +49,7 @@ def test_init_output_dir_existing(tmp_path):
     project_dir = init_output_dir(story, output_base=str(tmp_path / "output"))
     # Write a file
     marker = os.path.join(project_dir, "segments", "test.txt")
-    with open(marker, "w") as f:
-        f.write("marker")
+    Path(marker).write_text("marker")
     # Re-init
     project_dir2 = init_output_dir(story, output_base=str(tmp_path / "output"))
     assert project_dir == project_dir2
@@ -67,32 +74,36 @@ def test_write_artifact(tmp_path):
     assert loaded == data
 
 
-def test_write_artifact_nested_data(tmp_path):
-    """Handles nested dicts/lists correctly."""
-    project_dir = str(tmp_path)
-    data = {
+@pytest.mark.parametrize("data", [
+    {"test": "data"},
+    {"key": "value", "num": 42},
+    {
         "narrator": {"voice": "en-US-GuyNeural"},
         "characters": {
             "bob": {"voice": "en-US-DavisNeural", "aliases": ["robert"]},
         },
-    }
-    write_artifact(project_dir, "cast.json", data)
-    loaded = load_artifact(project_dir, "cast.json")
-    assert loaded == data
+    },
+], ids=["flat", "scalars", "nested"])
+def test_artifact_roundtrip(tmp_path, data):
+    """load_artifact returns exactly what write_artifact stored."""
+    write_artifact(str(tmp_path), "a.json", data)
+    assert load_artifact(str(tmp_path), "a.json") == data
 
 
 # --- Voice demos ---
 
-@patch("audiobook_producer.tts.generate_single")
-def test_generate_voice_demos(mock_tts, tmp_path):
-    """Mock TTS, verify 2 files per character with dialogue."""
+@pytest.fixture
+def fake_tts(silent_mp3):
+    """Patch tts.generate_single to write a silent MP3; yields the mock."""
     def write_mp3(text, voice, path):
-        AudioSegment.silent(duration=100).export(path, format="mp3")
+        Path(path).write_bytes(silent_mp3(100))
+
+    with patch("audiobook_producer.tts.generate_single", side_effect=write_mp3) as mock_tts:
+        yield mock_tts
 
-    mock_tts.side_effect = write_mp3
-    project_dir = str(tmp_path)
-    os.makedirs(os.path.join(project_dir, "voice_demos"), exist_ok=True)
 
+def test_generate_voice_demos(fake_tts, project_dir):
+    """Mock TTS, verify 2 files per character with dialogue."""
     cast_data = {
         "narrator": {"voice": "en-US-GuyNeural"},
         "characters": {"bob": {"voice": "en-US-DavisNeural"}},
@@ -108,16 +119,8 @@ def test_generate_voice_demos(mock_tts, tmp_path):
     assert len(paths) >= 3
 
 
-@patch("audiobook_producer.tts.generate_single")
-def test_voice_demo_filenames(mock_tts, tmp_path):
+def test_voice_demo_filenames(fake_tts, project_dir):
     """Verify slug-based naming."""
-    def write_mp3(text, voice, path):
-        AudioSegment.silent(duration=100).export(path, format="mp3")
-
-    mock_tts.side_effect = write_mp3
-    project_dir = str(tmp_path)
-    os.makedirs(os.path.join(project_dir, "voice_demos"), exist_ok=True)
-
     cast_data = {
         "narrator": {"voice": "en-US-GuyNeural"},
         "characters": {"the old man": {"voice": "en-US-DavisNeural"}},
@@ -131,18 +134,8 @@ def test_voice_demo_filenames(mock_tts, tmp_path):
     assert "the_old_man_pangram.mp3" in filenames
 
 
-@patch("audiobook_producer.tts.generate_single")
-def test_voice_demo_story_line(mock_tts, tmp_path):
+def test_voice_demo_story_line(fake_tts, project_dir):
     """Each character's story demo uses their first dialogue line."""
-    calls = []
-    def write_mp3(text, voice, path):
-        calls.append((text, voice, path))
-        AudioSegment.silent(duration=100).export(path, format="mp3")
-
-    mock_tts.side_effect = write_mp3
-    project_dir = str(tmp_path)
-    os.makedirs(os.path.join(project_dir, "voice_demos"), exist_ok=True)
-
     cast_data = {
         "narrator": {"voice": "en-US-GuyNeural"},
         "characters": {"bob": {"voice": "en-US-DavisNeural"}},
@@ -153,22 +146,15 @@ def test_voice_demo_story_line(mock_tts, tmp_path):
     ]
 
     generate_voice_demos(project_dir, cast_data, segments)
+    calls = [c.args for c in fake_tts.call_args_list]
     story_calls = [c for c in calls if "_story.mp3" in os.path.basename(c[2])]
     bob_story = [c for c in story_calls if "bob" in os.path.basename(c[2])]
     assert len(bob_story) == 1
     assert bob_story[0][0] == "First line."
 
 
-@patch("audiobook_producer.tts.generate_single")
-def test_voice_demo_no_dialogue(mock_tts, tmp_path):
+def test_voice_demo_no_dialogue(fake_tts, project_dir):
     """Character with no dialogue → pangram only, no crash."""
-    def write_mp3(text, voice, path):
-        AudioSegment.silent(duration=100).export(path, format="mp3")
-
-    mock_tts.side_effect = write_mp3
-    project_dir = str(tmp_path)
-    os.makedirs(os.path.join(project_dir, "voice_demos"), exist_ok=True)
-
     cast_data = {
         "narrator": {"voice": "en-US-GuyNeural"},
         "characters": {"silent_char": {"voice": "en-US-DavisNeural"}},
@@ -185,25 +171,48 @@ def test_voice_demo_no_dialogue(mock_tts, tmp_path):
 
 # --- Preview and chapters ---
 
-def test_generate_preview(tmp_path):
+def _mp3_duration_ms(path):
+    """Decoded length of an MP3; naming the codec skips pydub's ffprobe run."""
+    return len(AudioSegment.from_file(path, format="mp3", codec=MP3_DECODER))
+
+
+def test_generate_preview(project_dir):
     """Output file exists, duration close to target."""
-    project_dir = str(tmp_path)
-    os.makedirs(os.path.join(project_dir, "samples"), exist_ok=True)
     audio = AudioSegment.silent(duration=120000)  # 2 minutes
-    path = generate_preview(project_dir, audio)
-    assert os.path.exists(path)
-    preview = AudioSegment.from_mp3(path)
-    assert abs(len(preview) - 60000) < 500
+    result = generate_preview(project_dir, audio)
+    assert os.path.exists(result.path)
+    assert result.duration_ms == 60000
 
 
-def test_generate_preview_short_story(tmp_path):
+def test_generate_preview_short_story(project_dir):
     """Story shorter than preview duration → preview = full length."""
-    project_dir = str(tmp_path)
-    os.makedirs(os.path.join(project_dir, "samples"), exist_ok=True)
     audio = AudioSegment.silent(duration=30000)  # 30 seconds
-    path = generate_preview(project_dir, audio)
-    preview = AudioSegment.from_mp3(path)
-    assert abs(len(preview) - 30000) < 500
+    result = generate_preview(project_dir, audio)
+    assert os.path.exists(result.path)
+    assert result.duration_ms == 30000
+
+
+def test_generate_preview_from_exported_mp3(tmp_path, silent_mp3):
+    """Preview cut from the final MP3 has the preview duration."""
+    project_dir = str(tmp_path)
+    audio = AudioSegment.silent(duration=90000, frame_rate=8000)
+    source = str(tmp_path / "final.mp3")
+    Path(source).write_bytes(silent_mp3(90000, 8000))
+    result = generate_preview(project_dir, audio, source_mp3=source)
+    assert result.duration_ms == 60000
+    # Stream copy cuts on MP3 frame boundaries; check the file really matches
+    assert abs(_mp3_duration_ms(result.path) - result.duration_ms) < 500
+
+
+def test_generate_preview_length_from_source_mp3(tmp_path, silent_mp3):
+    """A short source MP3's own length bounds the preview, not the PCM's."""
+    project_dir = str(tmp_path)
+    audio = AudioSegment.silent(duration=30000, frame_rate=8000)
+    source = str(tmp_path / "final.mp3")
+    Path(source).write_bytes(silent_mp3(40000, 8000))
+    result = generate_preview(project_dir, audio, source_mp3=source)
+    assert 40000 <= result.duration_ms < 40500
+    assert abs(_mp3_duration_ms(result.path) - 40000) < 500
 
 
 def test_split_chapters_short_story(tmp_path):
@@ -215,11 +224,11 @@ def test_split_chapters_short_story(tmp_path):
     assert paths == []
 
 
-def test_split_chapters_long_story(tmp_path):
+@pytest.mark.slow
+def test_split_chapters_long_story(project_dir):
     """>50 segments → multiple chapter MP3s."""
-    project_dir = str(tmp_path)
-    os.makedirs(os.path.join(project_dir, "chapters"), exist_ok=True)
-    audio = AudioSegment.silent(duration=25 * 60 * 1000)  # 25 minutes
+    # 25 minutes at 8 kHz, LAME's lowest rate, to keep the chapter encodes short
+    audio = AudioSegment.silent(duration=25 * 60 * 1000, frame_rate=8000)
     segments = [Segment(type="narration", text="x", speaker="narrator") for _ in range(60)]
     paths = split_chapters(project_dir, audio, segments)
     assert len(paths) >= 2
@@ -227,6 +236,33 @@ def test_split_chapters_long_story(tmp_path):
         assert os.path.exists(p)
 
 
+@pytest.mark.slow
+def test_split_chapters_from_exported_mp3(tmp_path, silent_mp3):
+    """Chapters cut from the final MP3 cover the whole production."""
+    project_dir = str(tmp_path)
+    audio = AudioSegment.silent(duration=25 * 60 * 1000, frame_rate=8000)
+    source = str(tmp_path / "final.mp3")
+    Path(source).write_bytes(silent_mp3(25 * 60 * 1000, 8000))
+    segments = [Segment(type="narration", text="x", speaker="narrator") for _ in range(60)]
+    paths = split_chapters(project_dir, audio, segments, source_mp3=source)
+    assert len(paths) == 3
+    total = sum(_mp3_duration_ms(p) for p in paths)
+    assert abs(total - len(audio)) < 1000
+
+
+@pytest.mark.slow
+def test_split_chapters_keeps_source_mp3_tail(tmp_path, silent_mp3):
+    """A source MP3 longer than the PCM assembly is cut through to its end."""
+    project_dir = str(tmp_path)
+    audio = AudioSegment.silent(duration=24 * 60 * 1000, frame_rate=8000)
+    source = str(tmp_path / "final.mp3")
+    Path(source).write_bytes(silent_mp3(25 * 60 * 1000, 8000))
+    segments = [Segment(type="narration", text="x", speaker="narrator") for _ in range(60)]
+    paths = split_chapters(project_dir, audio, segments, source_mp3=source)
+    total = sum(_mp3_duration_ms(p) for p in paths)
+    assert abs(total - 25 * 60 * 1000) < 1000
+
+
 # --- Resumability ---
 
 def test_check_step_fresh_no_output(tmp_path):
@@ -234,18 +270,23 @@ def test_check_step_fresh_no_output(tmp_path):
     assert check_step_fresh(str(tmp_path), "parse") is False
 
 
+def test_check_step_fresh_empty_dir(tmp_path):
+    """Directory output with no files → returns False."""
+    os.makedirs(os.path.join(str(tmp_path), "segments"))
+    assert check_step_fresh(str(tmp_path), "tts") is False
+
+
 def test_check_step_fresh_stale(tmp_path):
     """Output exists but input is newer → returns False."""
     project_dir = str(tmp_path)
     # Create output first
     output = os.path.join(project_dir, "script.json")
-    with open(output, "w") as f:
-        json.dump({}, f)
-    time.sleep(0.05)
+    Path(output).write_text("{}")
     # Create newer input
     input_file = os.path.join(project_dir, "source.txt")
-    with open(input_file, "w") as f:
-        f.write("newer")
+    Path(input_file).write_text("newer")
+    _set_mtime(output, 1000)
+    _set_mtime(input_file, 2000)
     assert check_step_fresh(project_dir, "parse", [input_file]) is False
 
 
@@ -254,14 +295,28 @@ def test_check_step_fresh_current(tmp_path):
     project_dir = str(tmp_path)
     # Create input first
     input_file = os.path.join(project_dir, "source.txt")
-    with open(input_file, "w") as f:
-        f.write("old")
-    time.sleep(0.05)
+    Path(input_file).write_text("old")
     # Create output after
     output = os.path.join(project_dir, "script.json")
-    with open(output, "w") as f:
-        json.dump({}, f)
+    Path(output).write_text("{}")
+    _set_mtime(input_file, 1000)
+    _set_mtime(output, 2000)
+    assert check_step_fresh(project_dir, "parse", [input_file]) is True
+
+
+def test_check_step_fresh_touched_input_same_content(tmp_path):
+    """Input rewritten with identical content after recording → still fresh."""
+    project_dir = str(tmp_path)
+    input_file = os.path.join(project_dir, "source.txt")
+    Path(input_file).write_text("same")
+    output = write_artifact(project_dir, "script.json", {})
+    record_step_inputs(project_dir, "parse", [input_file])
+    Path(input_file).write_text("same")
+    _set_mtime(output, 1000)
+    _set_mtime(input_file, 2000)
     assert check_step_fresh(project_dir, "parse", [input_file]) is True
+    Path(input_file).write_text("changed")
+    assert check_step_fresh(project_dir, "parse", [input_file]) is False
 
 
 def test_check_step_fresh_multiple_inputs(tmp_path):
@@ -269,18 +324,16 @@ def test_check_step_fresh_multiple_inputs(tmp_path):
     project_dir = str(tmp_path)
     input1 = os.path.join(project_dir, "script.json")
     input2 = os.path.join(project_dir, "story.cast.json")
-    with open(input1, "w") as f:
-        json.dump({}, f)
-    with open(input2, "w") as f:
-        json.dump({}, f)
-    time.sleep(0.05)
+    Path(input1).write_text("{}")
+    Path(input2).write_text("{}")
     output = os.path.join(project_dir, "cast.json")
-    with open(output, "w") as f:
-        json.dump({}, f)
+    Path(output).write_text("{}")
+    _set_mtime(input1, 1000)
+    _set_mtime(input2, 1000)
+    _set_mtime(output, 2000)
     # Both inputs older → fresh
     assert check_step_fresh(project_dir, "voices", [input1, input2]) is True
-    # Touch one input to make it newer
-    time.sleep(0.05)
+    # Rewrite one input: its new mtime (now) is newer than the output's
     with open(input2, "w") as f:
         json.dump({"updated": True}, f)
     assert check_step_fresh(project_dir, "voices", [input1, input2]) is False
@@ -288,65 +341,82 @@ def test_check_step_fresh_multiple_inputs(tmp_path):
 
 # --- Loading and invalidation ---
 
-def test_load_artifact(tmp_path):
-    """Round-trips with write_artifact."""
-    data = {"test": "data"}
-    write_artifact(str(tmp_path), "test.json", data)
-    loaded = load_artifact(str(tmp_path), "test.json")
-    assert loaded == data
-
-
 def test_load_artifact_missing(tmp_path):
     """Returns None for non-existent file."""
     result = load_artifact(str(tmp_path), "nonexistent.json")
     assert result is None
 
 
-def test_invalidate_voice_change(tmp_path):
-    """Deletes voice_demos/, segments/, samples/, final/."""
-    project_dir = str(tmp_path)
-    for d in ["voice_demos", "segments", "samples", "final"]:
-        path = os.path.join(project_dir, d)
-        os.makedirs(path, exist_ok=True)
-        # Put a file in each
-        with open(os.path.join(path, "test.txt"), "w") as f:
-            f.write("test")
-
-    deleted = invalidate_downstream(project_dir, "voice")
-    assert set(deleted) == {"voice_demos", "segments", "samples", "final"}
-    # Dirs should exist but be empty
+def test_load_artifacts_keeps_order(tmp_path):
+    """Batch load returns one result per name, in order, None for missing."""
+    write_artifact(str(tmp_path), "a.json", {"n": 1})
+    write_artifact(str(tmp_path), "b.json", {"n": 2})
+    result = load_artifacts(str(tmp_path), ["b.json", "missing.json", "a.json"])
+    assert result == [{"n": 2}, None, {"n": 1}]
+
+
+def test_load_artifact_cached_copy(tmp_path):
+    """Mutating a loaded artifact doesn't leak into later loads."""
+    write_artifact(str(tmp_path), "cast.json", {"characters": {"bob": {}}})
+    first = load_artifact(str(tmp_path), "cast.json")
+    first["characters"]["bob"]["voice"] = "en-US-AriaNeural"
+    second = load_artifact(str(tmp_path), "cast.json")
+    assert second == {"characters": {"bob": {}}}
+
+
+def test_load_artifact_sees_external_edit(tmp_path):
+    """Hand-editing the file on disk invalidates the cached parse."""
+    write_artifact(str(tmp_path), "cast.json", {"narrator": {}})
+    assert load_artifact(str(tmp_path), "cast.json") == {"narrator": {}}
+    with open(os.path.join(str(tmp_path), "cast.json"), "w") as f:
+        json.dump({"narrator": {"voice": "en-GB-RyanNeural"}}, f)
+    assert load_artifact(str(tmp_path), "cast.json") == {"narrator": {"voice": "en-GB-RyanNeural"}}
+
+
+def test_write_artifact_unchanged_keeps_mtime(tmp_path):
+    """Rewriting identical data leaves the file (and its mtime) untouched."""
+    path = write_artifact(str(tmp_path), "cast.json", {"narrator": {}})
+    os.utime(path, (1_000_000, 1_000_000))
+    write_artifact(str(tmp_path), "cast.json", {"narrator": {}})
+    assert os.path.getmtime(path) == 1_000_000
+    write_artifact(str(tmp_path), "cast.json", {"narrator": {"voice": "x"}})
+    assert os.path.getmtime(path) > 1_000_000
+    assert load_artifact(str(tmp_path), "cast.json") == {"narrator": {"voice": "x"}}
+
+
+def test_artifact_roundtrip_without_orjson(tmp_path, monkeypatch):
+    """Stdlib json fallback reads and writes the same artifacts."""
+    monkeypatch.setattr("audiobook_producer.artifacts.ORJSON_AVAILABLE", False)
+    data = {"segments": [{"type": "narration", "text": "Caf\u00e9 \u2014 ok"}]}
+    write_artifact(str(tmp_path), "script.json", data)
+    assert load_artifact(str(tmp_path), "script.json") == data
+
+
+@pytest.fixture
+def make_dirs(tmp_path):
+    """make_dirs(names): create each subdir of tmp_path with a file in it."""
+    def make(names):
+        for name in names:
+            path = tmp_path / name
+            path.mkdir()
+            (path / "test.txt").write_text("test")
+    return make
+
+
+@pytest.mark.parametrize("setting, dirs", [
+    ("voice", ["voice_demos", "segments", "samples", "final"]),
+    ("music", ["music", "samples", "final"]),
+    ("reverb", ["segments", "samples", "final"]),
+])
+def test_invalidate_downstream(tmp_path, make_dirs, setting, dirs):
+    """Each setting clears exactly its downstream dirs, leaving them empty."""
+    make_dirs(dirs)
+    deleted = invalidate_downstream(str(tmp_path), setting)
+    assert set(deleted) == set(dirs)
     for d in deleted:
-        path = os.path.join(project_dir, d)
-        assert os.path.isdir(path)
-        assert os.listdir(path) == []
-
-
-def test_invalidate_music_toggle(tmp_path):
-    """Deletes music/, samples/, final/."""
-    project_dir = str(tmp_path)
-    for d in ["music", "samples", "final"]:
-        path = os.path.join(project_dir, d)
-        os.makedirs(path, exist_ok=True)
-        with open(os.path.join(path, "test.txt"), "w") as f:
-            f.write("test")
-
-    deleted = invalidate_downstream(project_dir, "music")
-    assert "music" in deleted
-    assert "samples" in deleted
-    assert "final" in deleted
-
-
-def test_invalidate_reverb_change(tmp_path):
-    """Deletes segments/, samples/, final/."""
-    project_dir = str(tmp_path)
-    for d in ["segments", "samples", "final"]:
-        path = os.path.join(project_dir, d)
-        os.makedirs(path, exist_ok=True)
-        with open(os.path.join(path, "test.txt"), "w") as f:
-            f.write("test")
-
-    deleted = invalidate_downstream(project_dir, "reverb")
-    assert set(deleted) == {"segments", "samples", "final"}
+        path = tmp_path / d
+        assert path.is_dir()
+        assert list(path.iterdir()) == []
 
 
 def test_invalidate_nonexistent_dirs(tmp_path):
@@ -387,8 +457,7 @@ def test_list_projects(tmp_path):
     for name in ["beta_story", "alpha_story"]:
         project = os.path.join(output_base, name)
         os.makedirs(project)
-        with open(os.path.join(project, "script.json"), "w") as f:
-            json.dump({}, f)
+        Path(os.path.join(project, "script.json")).write_text("{}")
     # Create a dir without script.json
     os.makedirs(os.path.join(output_base, "not_a_project"))
 
@@ -1,10 +1,17 @@
 """Tests for assembly module (Layer 2)."""
 
+import numpy as np
 import pytest
 from pydub import AudioSegment
 
 from audiobook_producer.models import Segment
-from audiobook_producer.assembly import assemble
+from audiobook_producer.assembly import (
+    assemble,
+    assemble_streamcopy,
+    _concatenate_with_pauses,
+    _frames,
+    _render_bed,
+)
 from audiobook_producer.constants import (
     PAUSE_SAME_TYPE_MS,
     PAUSE_SPEAKER_CHANGE_MS,
@@ -23,18 +30,27 @@ def _audio(duration_ms=500):
     return AudioSegment.silent(duration=duration_ms)
 
 
+# 10 s of fixed-seed 44.1 kHz mono noise; _loud_audio() slices from it, so
+# every run sees the same samples
+_NOISE = np.random.default_rng(0).integers(-5000, 5000, 44100 * 10, dtype=np.int16).tobytes()
+
+
 def _loud_audio(duration_ms=500):
-    """Create an AudioSegment with actual sound (not silence)."""
-    import numpy as np
-    samples = np.random.randint(-5000, 5000, int(44100 * duration_ms / 1000), dtype=np.int16)
+    """Create an AudioSegment with actual sound (not silence), up to 10 s."""
     return AudioSegment(
-        data=samples.tobytes(),
+        data=_NOISE[:2 * int(44100 * duration_ms / 1000)],
         sample_width=2,
         frame_rate=44100,
         channels=1,
     )
 
 
+@pytest.fixture(scope="module")
+def music_segment():
+    """5 s of music for the bookend tests; assemble() never modifies it."""
+    return _loud_audio(5000)
+
+
 # --- Story body pause tests ---
 
 def test_assemble_single_segment():
@@ -89,61 +105,94 @@ def test_assemble_pause_precedence():
 
 # --- Bookend structure tests ---
 
-def test_assemble_bookend_has_intro():
+def test_concatenate_mixed_formats():
+    """Mixed-format inputs are joined in the widest format with exact pauses."""
+    s1, s2 = _seg(), _seg(speaker="alice")
+    a1 = _audio(500)  # 11025 Hz mono
+    a2 = _loud_audio(500).set_channels(2)  # 44100 Hz stereo
+    result = _concatenate_with_pauses([s1, s2], [a1, a2])
+    assert result.frame_rate == 44100
+    assert result.channels == 2
+    assert len(result) == 500 + PAUSE_SPEAKER_CHANGE_MS + 500
+
+
+def test_render_bed_loops_to_duration():
+    """Short music is looped sample-for-sample and trimmed to the duration."""
+    music = _loud_audio(300)
+    bed = _render_bed(_frames(music), music, music.frame_rate)
+    assert len(bed) == 1000
+    assert bed.frame_rate == music.frame_rate
+    assert bed[300:600].raw_data == music.raw_data
+
+
+def test_render_bed_matches_pydub():
+    """Fused bed kernel matches the gain → fades → overlay pydub chain."""
+    bed = _loud_audio(2000)
+    narration = _loud_audio(1000)
+    expected = (bed - 20).fade_in(500).fade_out(500).overlay(narration, position=500)
+    samples = _frames(bed)
+    result = _render_bed(
+        samples, bed, len(samples),
+        gain_db=-20, fade_in_ms=500, fade_out_ms=500,
+        narration=narration, overlay_pos_ms=500,
+    )
+    assert len(result) == len(expected)
+    assert abs(result.dBFS - expected.dBFS) < 0.5
+    assert abs(result[:500].dBFS - expected[:500].dBFS) < 0.5
+
+
+def test_assemble_bookend_has_intro(music_segment):
     """Output starts with intro segments before story."""
     intro_seg = _seg()
     intro_audio = _audio(1000)
     story_seg = _seg()
     story_audio = _audio(500)
-    music = _loud_audio(5000)
 
     result = assemble(
         [intro_seg], [intro_audio],
         [story_seg], [story_audio],
         [], [],
-        music=music,
+        music=music_segment,
     )
     # Total should be longer than just story
     assert len(result) > len(story_audio) + 1000
 
 
-def test_assemble_bookend_has_outro():
+def test_assemble_bookend_has_outro(music_segment):
     """Output ends with outro segments after story."""
     story_seg = _seg()
     story_audio = _audio(500)
     outro_seg = _seg()
     outro_audio = _audio(1000)
-    music = _loud_audio(5000)
 
     result = assemble(
         [], [],
         [story_seg], [story_audio],
         [outro_seg], [outro_audio],
-        music=music,
+        music=music_segment,
     )
     assert len(result) > len(story_audio) + 1000
 
 
-def test_assemble_bookend_music_intro():
+def test_assemble_bookend_music_intro(music_segment):
     """First section of output has music (RMS check)."""
     intro_seg = _seg()
     intro_audio = _audio(1000)
     story_seg = _seg()
     story_audio = _audio(2000)
-    music = _loud_audio(5000)
 
     result = assemble(
         [intro_seg], [intro_audio],
         [story_seg], [story_audio],
         [], [],
-        music=music,
+        music=music_segment,
     )
     # First INTRO_MUSIC_SOLO_MS should have audible music
     intro_section = result[:INTRO_MUSIC_SOLO_MS]
     assert intro_section.rms > 0
 
 
-def test_assemble_bookend_no_music_mid():
+def test_assemble_bookend_no_music_mid(music_segment):
     """Middle section of output has no music background."""
     intro_seg = _seg()
     intro_audio = _audio(500)
@@ -152,20 +201,19 @@ def test_assemble_bookend_no_music_mid():
     story_audios = [_audio(2000) for _ in range(3)]
     outro_seg = _seg()
     outro_audio = _audio(500)
-    music = _loud_audio(5000)
 
     result = assemble(
         [intro_seg], [intro_audio],
         story_segs, story_audios,
         [outro_seg], [outro_audio],
-        music=music,
+        music=music_segment,
     )
     # The story section in the middle should be silent where there's no narration
     # Just verify the assembly completes and has reasonable length
     assert len(result) > 8000  # should be at least 8 seconds
 
 
-def test_assemble_no_music_flag():
+def test_assemble_no_music_flag(music_segment):
     """When no_music=True, no music anywhere."""
     intro_seg = _seg()
     intro_audio = _audio(500)
@@ -173,15 +221,60 @@ def test_assemble_no_music_flag():
     story_audio = _audio(500)
     outro_seg = _seg()
     outro_audio = _audio(500)
-    music = _loud_audio(5000)
 
     result = assemble(
         [intro_seg], [intro_audio],
         [story_seg], [story_audio],
         [outro_seg], [outro_audio],
-        music=music,
+        music=music_segment,
         no_music=True,
     )
     # In no-music mode, result should be approximately narration + pauses only
     # No music solo sections
     assert len(result) < 5000  # should be much shorter without music bookends
+
+
+def _onsets_ms(audio, threshold=2000):
+    """Start of each loud run, at 10 ms resolution."""
+    samples = np.abs(np.frombuffer(audio.raw_data, dtype=np.int16).astype(np.int32))
+    window = audio.frame_rate // 100
+    loud = (samples[:len(samples) // window * window] > threshold).reshape(-1, window).any(axis=1)
+    return (np.flatnonzero(loud[1:] & ~loud[:-1]) + 1) * 10
+
+
+def test_assemble_streamcopy_no_music(tmp_path):
+    """Every stitched segment starts where assemble(no_music=True) puts it.
+
+    MP3 encoder delay and padding add ~60 ms per file at 24 kHz; a constant
+    correction left ~10-50 ms of error per gap, which adds up over a book.
+    """
+    n = 60
+    rate = 24000
+    path = str(tmp_path / "seg.mp3")
+    noise = np.random.default_rng(0).integers(-8000, 8000, rate, dtype=np.int16)
+    AudioSegment(
+        data=noise.tobytes(), sample_width=2, frame_rate=rate, channels=1,
+    ).export(path, format="mp3")
+    decoded = AudioSegment.from_mp3(path)
+    segs = [
+        _seg(type_="dialogue", speaker="alice") if i % 3 == 0 else _seg()
+        for i in range(n)
+    ]
+
+    out = assemble_streamcopy(
+        [], [], segs, [path] * n, [], [],
+        sample_counts=[int(decoded.frame_count())] * n,
+        out_path=str(tmp_path / "out.mp3"),
+        silence_dir=str(tmp_path / "samples"),
+        frame_rate=rate,
+        channels=1,
+    )
+
+    expected = assemble([], [], segs, [decoded] * n, [], [], no_music=True)
+    result = AudioSegment.from_mp3(out)
+    assert result.frame_rate == rate
+    expected_onsets, onsets = _onsets_ms(expected), _onsets_ms(result)
+    assert len(onsets) == len(expected_onsets) == n
+    # Within one 24 ms frame plus the 10 ms resolution, at every gap
+    assert np.abs(onsets - expected_onsets).max() <= 40
+    assert abs(len(result) - len(expected)) < 100
\ No newline at end of file
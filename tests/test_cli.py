@@ -4,13 +4,19 @@ import json
 import os
 import shutil
 import sys
-from unittest.mock import patch, MagicMock
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
-from pydub import AudioSegment
 
 from audiobook_producer.cli import main, cmd_new, cmd_run, cmd_set
-from audiobook_producer.constants import OUTPUT_DIR, NARRATOR_VOICE
+from audiobook_producer.constants import (
+    OUTPUT_DIR,
+    NARRATOR_VOICE,
+    PAUSE_SAME_TYPE_MS,
+    PAUSE_SPEAKER_CHANGE_MS,
+    PAUSE_TYPE_TRANSITION_MS,
+)
 
 
 # --- Helpers ---
@@ -24,6 +30,28 @@ def _create_story_file(tmp_path, name="story.txt", content=None):
     return str(path)
 
 
+# Static project artifacts, encoded once; only script.json varies per test
+_CAST_JSON = json.dumps({
+    "narrator": {"voice": NARRATOR_VOICE, "dialogue_voice": "en-GB-RyanNeural"},
+    "characters": {"alice": {"voice": "en-US-AriaNeural", "source": "hash"}},
+}).encode()
+
+_DIRECTION_JSON = json.dumps({
+    "intro_music_solo_ms": 4000, "outro_music_solo_ms": 4000,
+    "music_bed_db": -25, "music_fade_ms": 2000,
+    "pauses": {"same_type_ms": 300, "speaker_change_ms": 500, "type_transition_ms": 700},
+    "no_music": False, "music_source": None,
+}).encode()
+
+_EFFECTS_JSON = json.dumps({
+    "global": {"normalize": True, "target_dbfs": -20},
+    "per_segment": {
+        "dialogue": {"reverb": {"room_size": 0.3, "wet_level": 0.15}},
+        "narration": {"reverb": None},
+    },
+}).encode()
+
+
 def _create_project(tmp_path, slug="test_story"):
     """Create a minimal project with all required artifacts."""
     output_dir = tmp_path / "output" / slug
@@ -46,55 +74,18 @@ def _create_project(tmp_path, slug="test_story"):
              "speaker": "narrator", "voice": NARRATOR_VOICE},
         ],
     }
-    with open(output_dir / "script.json", "w") as f:
-        json.dump(script, f)
-
-    cast = {
-        "narrator": {"voice": NARRATOR_VOICE, "dialogue_voice": "en-GB-RyanNeural"},
-        "characters": {"alice": {"voice": "en-US-AriaNeural", "source": "hash"}},
-    }
-    with open(output_dir / "cast.json", "w") as f:
-        json.dump(cast, f)
-
-    direction = {
-        "intro_music_solo_ms": 4000, "outro_music_solo_ms": 4000,
-        "music_bed_db": -25, "music_fade_ms": 2000,
-        "pauses": {"same_type_ms": 300, "speaker_change_ms": 500, "type_transition_ms": 700},
-        "no_music": False, "music_source": None,
-    }
-    with open(output_dir / "direction.json", "w") as f:
-        json.dump(direction, f)
-
-    effects = {
-        "global": {"normalize": True, "target_dbfs": -20},
-        "per_segment": {
-            "dialogue": {"reverb": {"room_size": 0.3, "wet_level": 0.15}},
-            "narration": {"reverb": None},
-        },
-    }
-    with open(output_dir / "effects.json", "w") as f:
-        json.dump(effects, f)
+    (output_dir / "script.json").write_text(json.dumps(script))
+    (output_dir / "cast.json").write_bytes(_CAST_JSON)
+    (output_dir / "direction.json").write_bytes(_DIRECTION_JSON)
+    (output_dir / "effects.json").write_bytes(_EFFECTS_JSON)
 
     return str(output_dir)
 
 
-def _mock_tts_communicate():
-    """Create a mock edge_tts.Communicate factory."""
-    def factory(text, voice, **kwargs):
-        mock = MagicMock()
-        async def save(path):
-            AudioSegment.silent(duration=100).export(path, format="mp3")
-        mock.save = save
-        return mock
-    return factory
-
-
 # --- Subcommand routing ---
 
-def test_cli_new_creates_project(tmp_path, monkeypatch):
+def test_cli_new_creates_project(tmp_path):
     """new creates output dir + script.json + cast.json."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
     story = _create_story_file(tmp_path, "test_story.txt")
 
     with patch("sys.argv", ["producer.py", "new", story]):
@@ -107,27 +98,35 @@ def test_cli_new_creates_project(tmp_path, monkeypatch):
     assert (project / "effects.json").exists()
 
 
-def test_cli_new_already_exists(tmp_path, monkeypatch):
-    """new on existing project raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
+def test_cli_new_direction_matches_constants(tmp_path):
+    """direction.json defaults record the pauses assembly actually uses."""
     story = _create_story_file(tmp_path, "test_story.txt")
 
     with patch("sys.argv", ["producer.py", "new", story]):
         main()
 
+    direction = json.loads((tmp_path / "output" / "test_story" / "direction.json").read_bytes())
+    assert direction["pauses"] == {
+        "same_type_ms": PAUSE_SAME_TYPE_MS,
+        "speaker_change_ms": PAUSE_SPEAKER_CHANGE_MS,
+        "type_transition_ms": PAUSE_TYPE_TRANSITION_MS,
+    }
+
+
+def test_cli_new_already_exists(tmp_path):
+    """new on existing project raises SystemExit."""
+    story = _create_story_file(tmp_path, "test_story.txt")
+    script = os.path.join(_create_project(tmp_path, "test_story"), "script.json")
+    before = Path(script).read_bytes()
+
     with pytest.raises(SystemExit):
         with patch("sys.argv", ["producer.py", "new", story]):
             main()
+    assert Path(script).read_bytes() == before
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_cli_run_basic(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_cli_run_basic(mock_communicate, tmp_path):
     """run executes pipeline steps."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
     _create_project(tmp_path, "test_story")
 
     with patch("sys.argv", ["producer.py", "run", "test_story"]):
@@ -136,24 +135,17 @@ def test_cli_run_basic(mock_which, mock_comm, tmp_path, monkeypatch):
     assert (tmp_path / "output" / "test_story" / "final" / "test_story.mp3").exists()
 
 
-def test_cli_run_nonexistent_project(tmp_path, monkeypatch):
+def test_cli_run_nonexistent_project(tmp_path):
     """run on nonexistent project raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     (tmp_path / "output").mkdir()
 
     with pytest.raises(SystemExit):
         with patch("sys.argv", ["producer.py", "run", "nonexistent"]):
-            with patch("shutil.which", return_value="/usr/bin/ffmpeg"):
-                main()
+            main()
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_cli_run_verbose(mock_which, mock_comm, tmp_path, monkeypatch, capsys):
+def test_cli_run_verbose(mock_communicate, tmp_path, capsys):
     """run -v enables voice demos."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
     _create_project(tmp_path, "test_story")
 
     # Mock stdin as non-interactive to skip preview gate
@@ -166,18 +158,47 @@ def test_cli_run_verbose(mock_which, mock_comm, tmp_path, monkeypatch, capsys):
     assert "voice demos" in captured.out.lower() or "Generating" in captured.out
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_cli_run_force(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_cli_run_verbose_voice_demos_follow_cast(mock_communicate, tmp_path, capsys):
+    """run -v regenerates voice demos only when cast.json's content changes."""
+    project_dir = _create_project(tmp_path, "test_story")
+    cast_path = os.path.join(project_dir, "cast.json")
+    argv = ["producer.py", "run", "test_story", "-v"]
+
+    def run():
+        with patch("sys.stdin") as mock_stdin:
+            mock_stdin.isatty.return_value = False
+            with patch("sys.argv", argv):
+                main()
+        return capsys.readouterr().out
+
+    assert "Generating voice demos..." in run()
+    demo_dir = os.path.join(project_dir, "voice_demos")
+    later = max(os.path.getmtime(os.path.join(demo_dir, f)) for f in os.listdir(demo_dir)) + 10
+
+    # Rewritten with identical content: newer mtime, same demos
+    Path(cast_path).write_bytes(_CAST_JSON)
+    os.utime(cast_path, (later, later))
+    mock_communicate.reset_mock()
+    assert "[skip] Voice demos: up to date" in run()
+    assert mock_communicate.call_count == 0
+
+    # A different voice for alice: her old demos are replaced
+    cast = json.loads(_CAST_JSON)
+    cast["characters"]["alice"]["voice"] = "en-US-JennyNeural"
+    Path(cast_path).write_text(json.dumps(cast))
+    os.utime(cast_path, (later, later))
+    assert "Generating voice demos..." in run()
+    voices = [call.args[1] for call in mock_communicate.call_args_list]
+    assert "en-US-JennyNeural" in voices
+
+
+def test_cli_run_force(mock_communicate, tmp_path, silent_mp3):
     """run --force re-runs everything."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
     _create_project(tmp_path, "test_story")
 
     # Create a fake final output
     final_dir = tmp_path / "output" / "test_story" / "final"
-    AudioSegment.silent(duration=100).export(str(final_dir / "test_story.mp3"), format="mp3")
+    (final_dir / "test_story.mp3").write_bytes(silent_mp3(100))
 
     with patch("sys.argv", ["producer.py", "run", "test_story", "--force"]):
         main()
@@ -186,9 +207,8 @@ def test_cli_run_force(mock_which, mock_comm, tmp_path, monkeypatch):
     assert (final_dir / "test_story.mp3").exists()
 
 
-def test_cli_status_shows_state(tmp_path, monkeypatch, capsys):
+def test_cli_status_shows_state(tmp_path, capsys):
     """status prints project state."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     _create_project(tmp_path, "test_story")
 
     with patch("sys.argv", ["producer.py", "status", "test_story"]):
@@ -199,9 +219,8 @@ def test_cli_status_shows_state(tmp_path, monkeypatch, capsys):
     assert "parse" in captured.out.lower() or "Steps" in captured.out
 
 
-def test_cli_status_nonexistent(tmp_path, monkeypatch):
+def test_cli_status_nonexistent(tmp_path):
     """status on nonexistent project raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     (tmp_path / "output").mkdir()
 
     with pytest.raises(SystemExit):
@@ -211,21 +230,41 @@ def test_cli_status_nonexistent(tmp_path, monkeypatch):
 
 # --- Set subcommand ---
 
-def test_cli_set_voice(tmp_path, monkeypatch):
-    """set voice updates cast.json."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
+@pytest.mark.parametrize("args, artifact, keys, expected", [
+    (["voice", "alice", "en-US-TonyNeural"], "cast.json",
+     ["characters", "alice", "voice"], "en-US-TonyNeural"),
+    (["music", "off"], "direction.json", ["no_music"], True),
+    (["reverb-room", "0.5"], "effects.json",
+     ["per_segment", "dialogue", "reverb", "room_size"], 0.5),
+], ids=["voice", "music-off", "reverb-room"])
+def test_cli_set_updates_artifact(tmp_path, args, artifact, keys, expected):
+    """set writes the new value into the artifact that owns it."""
     _create_project(tmp_path, "test_story")
 
-    with patch("sys.argv", ["producer.py", "set", "test_story", "voice", "alice", "en-US-TonyNeural"]):
+    with patch("sys.argv", ["producer.py", "set", "test_story", *args]):
         main()
 
-    cast = json.loads((tmp_path / "output" / "test_story" / "cast.json").read_text())
-    assert cast["characters"]["alice"]["voice"] == "en-US-TonyNeural"
+    value = json.loads((tmp_path / "output" / "test_story" / artifact).read_bytes())
+    for key in keys:
+        value = value[key]
+    assert value == expected
+
+
+@pytest.mark.parametrize("args", [
+    ["music-file", "nonexistent.mp3"],
+    ["badkey", "val"],
+], ids=["missing-music-file", "invalid-key"])
+def test_cli_set_rejects_bad_input(tmp_path, args):
+    """set exits on a missing music file or an unknown key."""
+    _create_project(tmp_path, "test_story")
+
+    with pytest.raises(SystemExit):
+        with patch("sys.argv", ["producer.py", "set", "test_story", *args]):
+            main()
 
 
-def test_cli_set_voice_invalidates(tmp_path, monkeypatch):
+def test_cli_set_voice_invalidates(tmp_path):
     """After set voice, voice_demos/ and segments/ are deleted."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     project = _create_project(tmp_path, "test_story")
 
     # Add files to voice_demos and segments
@@ -240,49 +279,25 @@ def test_cli_set_voice_invalidates(tmp_path, monkeypatch):
     assert len(os.listdir(tmp_path / "output" / "test_story" / "voice_demos")) == 0
 
 
-def test_cli_set_music_off(tmp_path, monkeypatch):
-    """set music off updates direction.json."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    _create_project(tmp_path, "test_story")
-
-    with patch("sys.argv", ["producer.py", "set", "test_story", "music", "off"]):
-        main()
-
-    direction = json.loads((tmp_path / "output" / "test_story" / "direction.json").read_text())
-    assert direction["no_music"] is True
-
-
-def test_cli_set_music_file(tmp_path, monkeypatch):
+def test_cli_set_music_file(tmp_path, silent_mp3):
     """set music-file copies file and writes provenance."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     _create_project(tmp_path, "test_story")
 
     # Create a test music file
     track = tmp_path / "track.mp3"
-    AudioSegment.silent(duration=5000).export(str(track), format="mp3")
+    track.write_bytes(silent_mp3(5000, 11025))
 
     with patch("sys.argv", ["producer.py", "set", "test_story", "music-file", str(track)]):
         main()
 
     bg = tmp_path / "output" / "test_story" / "music" / "background.mp3"
     assert bg.exists()
-    direction = json.loads((tmp_path / "output" / "test_story" / "direction.json").read_text())
+    direction = json.loads((tmp_path / "output" / "test_story" / "direction.json").read_bytes())
     assert direction["music_source"] == "user:track.mp3"
 
 
-def test_cli_set_music_file_missing(tmp_path, monkeypatch):
-    """set music-file with nonexistent file raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    _create_project(tmp_path, "test_story")
-
-    with pytest.raises(SystemExit):
-        with patch("sys.argv", ["producer.py", "set", "test_story", "music-file", "nonexistent.mp3"]):
-            main()
-
-
-def test_cli_set_music_file_invalid_audio(tmp_path, monkeypatch):
+def test_cli_set_music_file_invalid_audio(tmp_path):
     """set music-file with non-audio file raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     _create_project(tmp_path, "test_story")
 
     bad_file = tmp_path / "photo.jpg"
@@ -293,16 +308,15 @@ def test_cli_set_music_file_invalid_audio(tmp_path, monkeypatch):
             main()
 
 
-def test_cli_set_music_file_invalidates(tmp_path, monkeypatch):
+def test_cli_set_music_file_invalidates(tmp_path, silent_mp3):
     """After set music-file, samples/ and final/ deleted."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     _create_project(tmp_path, "test_story")
 
     (tmp_path / "output" / "test_story" / "samples" / "test.mp3").write_text("x")
     (tmp_path / "output" / "test_story" / "final" / "test.mp3").write_text("x")
 
     track = tmp_path / "track.mp3"
-    AudioSegment.silent(duration=5000).export(str(track), format="mp3")
+    track.write_bytes(silent_mp3(5000, 11025))
 
     with patch("sys.argv", ["producer.py", "set", "test_story", "music-file", str(track)]):
         main()
@@ -311,21 +325,8 @@ def test_cli_set_music_file_invalidates(tmp_path, monkeypatch):
     assert len(os.listdir(tmp_path / "output" / "test_story" / "final")) == 0
 
 
-def test_cli_set_reverb_room(tmp_path, monkeypatch):
-    """set reverb-room updates effects.json."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    _create_project(tmp_path, "test_story")
-
-    with patch("sys.argv", ["producer.py", "set", "test_story", "reverb-room", "0.5"]):
-        main()
-
-    effects = json.loads((tmp_path / "output" / "test_story" / "effects.json").read_text())
-    assert effects["per_segment"]["dialogue"]["reverb"]["room_size"] == 0.5
-
-
-def test_cli_set_nonexistent_project(tmp_path, monkeypatch):
+def test_cli_set_nonexistent_project(tmp_path):
     """set on nonexistent project raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     (tmp_path / "output").mkdir()
 
     with pytest.raises(SystemExit):
@@ -333,22 +334,10 @@ def test_cli_set_nonexistent_project(tmp_path, monkeypatch):
             main()
 
 
-def test_cli_set_invalid_key(tmp_path, monkeypatch):
-    """set with invalid key raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    _create_project(tmp_path, "test_story")
-
-    with pytest.raises(SystemExit):
-        with patch("sys.argv", ["producer.py", "set", "test_story", "badkey", "val"]):
-            main()
-
-
 # --- List and voices ---
 
-def test_cli_list_projects(tmp_path, monkeypatch, capsys):
+def test_cli_list_projects(tmp_path, capsys):
     """list shows all project dirs."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
     _create_project(tmp_path, "alpha_story")
     _create_project(tmp_path, "beta_story")
 
@@ -360,10 +349,8 @@ def test_cli_list_projects(tmp_path, monkeypatch, capsys):
     assert "beta_story" in captured.out
 
 
-def test_cli_list_empty(tmp_path, monkeypatch, capsys):
+def test_cli_list_empty(tmp_path, capsys):
     """list with no projects shows message."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
     (tmp_path / "output").mkdir()
 
     with patch("sys.argv", ["producer.py", "list"]):
@@ -406,17 +393,15 @@ def test_cli_no_args_shows_help(capsys):
 
 # --- Input validation ---
 
-def test_validate_missing_file(tmp_path, monkeypatch):
+def test_validate_missing_file(tmp_path):
     """new with nonexistent file raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     with pytest.raises(SystemExit):
         with patch("sys.argv", ["producer.py", "new", str(tmp_path / "nonexistent.txt")]):
             main()
 
 
-def test_validate_empty_file(tmp_path, monkeypatch):
+def test_validate_empty_file(tmp_path):
     """new with empty file raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     empty = tmp_path / "empty.txt"
     empty.write_text("")
     with pytest.raises(SystemExit):
@@ -424,10 +409,8 @@ def test_validate_empty_file(tmp_path, monkeypatch):
             main()
 
 
-def test_validate_no_segments(tmp_path, monkeypatch):
+def test_validate_no_segments(tmp_path):
     """new with unparseable file raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
     bad = tmp_path / "bad.txt"
     bad.write_text("   \n\n   \n\n   ")
     with pytest.raises(SystemExit):
@@ -435,10 +418,9 @@ def test_validate_no_segments(tmp_path, monkeypatch):
             main()
 
 
-@patch("shutil.which", return_value=None)
-def test_validate_ffmpeg_missing(mock_which, tmp_path, monkeypatch):
+def test_validate_ffmpeg_missing(tmp_path, monkeypatch):
     """run without ffmpeg raises SystemExit."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
+    monkeypatch.setattr(shutil, "which", lambda name, *args, **kwargs: None)
     _create_project(tmp_path, "test_story")
 
     with pytest.raises(SystemExit):
@@ -448,13 +430,8 @@ def test_validate_ffmpeg_missing(mock_which, tmp_path, monkeypatch):
 
 # --- Preview gate ---
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_preview_gate_verbose(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_preview_gate_verbose(mock_communicate, tmp_path):
     """run -v with isatty()=True calls input()."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
     _create_project(tmp_path, "test_story")
 
     with patch("sys.stdin") as mock_stdin:
@@ -465,13 +442,8 @@ def test_preview_gate_verbose(mock_which, mock_comm, tmp_path, monkeypatch):
             mock_input.assert_called_once()
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_preview_gate_nonverbose(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_preview_gate_nonverbose(mock_communicate, tmp_path):
     """run without -v has no input() call."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
     _create_project(tmp_path, "test_story")
 
     with patch("builtins.input") as mock_input:
@@ -480,13 +452,8 @@ def test_preview_gate_nonverbose(mock_which, mock_comm, tmp_path, monkeypatch):
         mock_input.assert_not_called()
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_preview_gate_noninteractive(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_preview_gate_noninteractive(mock_communicate, tmp_path):
     """run -v but non-interactive → no input() call."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
     _create_project(tmp_path, "test_story")
 
     with patch("sys.stdin") as mock_stdin:
@@ -499,13 +466,8 @@ def test_preview_gate_noninteractive(mock_which, mock_comm, tmp_path, monkeypatc
 
 # --- Resumability ---
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_run_skips_completed_steps(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_run_skips_completed_steps(mock_communicate, tmp_path):
     """When artifacts exist and fresh, TTS is skipped on second run."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
     _create_project(tmp_path, "test_story")
 
     # First run
@@ -513,8 +475,7 @@ def test_run_skips_completed_steps(mock_which, mock_comm, tmp_path, monkeypatch)
         main()
 
     # Reset mock call count
-    mock_comm.reset_mock()
-    mock_comm.side_effect = _mock_tts_communicate()
+    mock_communicate.reset_mock()
 
     # Second run — should skip TTS
     with patch("sys.argv", ["producer.py", "run", "test_story"]):
@@ -526,13 +487,8 @@ def test_run_skips_completed_steps(mock_which, mock_comm, tmp_path, monkeypatch)
     assert (tmp_path / "output" / "test_story" / "final" / "test_story.mp3").exists()
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_force_flag_deletes_output(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_force_flag_deletes_output(mock_communicate, tmp_path):
     """--force removes generated artifacts before starting."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
     _create_project(tmp_path, "test_story")
 
     # Add a marker file to segments/
@@ -548,10 +504,8 @@ def test_force_flag_deletes_output(mock_which, mock_comm, tmp_path, monkeypatch)
     assert (tmp_path / "output" / "test_story" / "final" / "test_story.mp3").exists()
 
 
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_force_flag_no_existing_dir(mock_which, tmp_path, monkeypatch):
+def test_force_flag_no_existing_dir(tmp_path):
     """--force on non-existent output dir doesn't crash."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
     (tmp_path / "output").mkdir()
 
     with pytest.raises(SystemExit):
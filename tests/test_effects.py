@@ -1,10 +1,21 @@
 """Tests for effects module (Layer 1e)."""
 
+import os
+from unittest.mock import patch
+
 import pytest
 from pydub import AudioSegment
 
 from audiobook_producer.models import Segment
-from audiobook_producer.effects import apply_reverb, normalize_levels, process_segments
+from audiobook_producer.effects import (
+    apply_reverb,
+    normalize_levels,
+    process_segments,
+    apply_segment_effects,
+    load_segment_files,
+    _apply_gain,
+    _dbfs,
+)
 
 
 def _make_audio(duration=500, volume_db=0):
@@ -38,6 +49,14 @@ def test_reverb_fallback_no_pedalboard():
         eff.PEDALBOARD_AVAILABLE = original_available
 
 
+def test_reverb_non_16bit_input():
+    """8-bit audio is widened to 16-bit before reverb, keeping its length."""
+    audio = _make_audio(500).set_sample_width(1)
+    result = apply_reverb(audio)
+    assert result.sample_width == 2
+    assert result.frame_count() == audio.frame_count()
+
+
 def test_reverb_on_narration():
     """Narration segments get lighter reverb than dialogue."""
     segments = [
@@ -62,6 +81,30 @@ def test_normalize_levels():
         assert max(dbfs_values) - min(dbfs_values) < 6  # within 6dB
 
 
+@pytest.mark.parametrize("gain_db", [-7.3, 3.1, 12.0])
+def test_apply_gain_matches_pydub(gain_db):
+    """NumPy gain agrees with pydub's `audio + dB` to within rounding, saturating."""
+    import numpy as np
+    samples = np.random.default_rng(1).integers(-20000, 20000, 24000, dtype=np.int16)
+    audio = AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=24000, channels=1)
+    ours = np.frombuffer(_apply_gain(audio, gain_db).raw_data, np.int16).astype(np.int32)
+    theirs = np.frombuffer((audio + gain_db).raw_data, np.int16)
+    assert np.abs(ours - theirs).max() <= 1
+
+
+@pytest.mark.parametrize("amplitude", [0, 3000, 30000])
+def test_dbfs_matches_pydub(amplitude):
+    """Vectorized level agrees with AudioSegment.dBFS; silence is -inf."""
+    import numpy as np
+    samples = np.random.default_rng(1).integers(-amplitude, amplitude + 1, 24000, dtype=np.int16)
+    audio = AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=24000, channels=1)
+    ours = _dbfs(samples.astype(np.float32))
+    if audio.dBFS == float("-inf"):
+        assert ours == float("-inf")
+    else:
+        assert abs(ours - audio.dBFS) < 0.05
+
+
 def test_process_segments_passthrough():
     """When no effects enabled, output matches input."""
     segments = [
@@ -71,3 +114,47 @@ def test_process_segments_passthrough():
     audio_map = {"narration_0": audio}
     result = process_segments(segments, audio_map, reverb=False, normalize=False)
     assert len(result["narration_0"]) == len(audio)
+
+
+def test_apply_segment_effects(tmp_path):
+    """The file is processed in place."""
+    import numpy as np
+    path = str(tmp_path / "000.mp3")
+    samples = np.random.randint(-3000, 3000, 24 * 400, dtype=np.int16)
+    AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=24000, channels=1).export(
+        path, format="mp3"
+    )
+
+    apply_segment_effects(path, "dialogue")
+    # Lossy re-encode of white noise shifts level by about a dB
+    assert abs(AudioSegment.from_mp3(path).dBFS - (-20.0)) < 2.5
+
+
+def test_apply_segment_effects_no_effects_skips_export(tiny_mp3):
+    """With reverb and normalization off the MP3 is only decoded, not rewritten."""
+    before = tiny_mp3.read_bytes()
+    mtime = tiny_mp3.stat().st_mtime_ns
+    apply_segment_effects(str(tiny_mp3), "dialogue", reverb=False, normalize=False)
+    assert tiny_mp3.read_bytes() == before
+    assert tiny_mp3.stat().st_mtime_ns == mtime
+
+
+def test_apply_segment_effects_then_load_uses_sidecar(tmp_path):
+    """Effects applied at TTS time leave a sidecar the loader reads back."""
+    import numpy as np
+    path = str(tmp_path / "000.mp3")
+    samples = np.random.randint(-3000, 3000, 24 * 300, dtype=np.int16)
+    AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=24000, channels=1).export(
+        path, format="mp3"
+    )
+    cache_dir = str(tmp_path / ".cache")
+    (tmp_path / ".cache").mkdir()
+    (tmp_path / ".cache" / "stale.wav").write_bytes(b"")
+
+    apply_segment_effects(path, "narration", cache_dir=cache_dir)
+
+    with patch.object(AudioSegment, "from_file", wraps=AudioSegment.from_file) as from_file:
+        loaded = load_segment_files([path], cache_dir=cache_dir)
+    assert not [c for c in from_file.call_args_list if str(c.args[0]).endswith(".mp3")]
+    assert abs(loaded[0].dBFS - (-20.0)) < 1.0
+    assert "stale.wav" not in os.listdir(cache_dir)
@@ -7,6 +7,7 @@ import pytest
 from pydub import AudioSegment
 
 from audiobook_producer.exporter import export
+from audiobook_producer.mp3 import bitrate_kbps
 
 
 def _make_assembled(duration_ms=5000):
@@ -33,7 +34,6 @@ def _make_settings():
         "reverb": True,
         "reverb_room_size": 0.3,
         "reverb_wet_level": 0.15,
-        "bitrate": "192k",
     }
 
 
@@ -49,16 +49,42 @@ def test_export_creates_file(tmp_path):
     assert os.path.getsize(path) > 0
 
 
+def _mpeg_sync_after_id3(path):
+    """True if the file is an optional ID3v2 tag followed by an MPEG frame sync."""
+    with open(path, "rb") as f:
+        head = f.read(10)
+        if head[:3] == b"ID3":
+            # Tag size is four 7-bit bytes, excluding the 10-byte header
+            size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+            f.seek(10 + size)
+            head = f.read(2)
+    return len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0
+
+
 def test_export_is_valid_mp3(tmp_path):
-    """Pydub can reload the exported file."""
+    """Exported file is an ID3 tag followed by MPEG audio frames."""
     project_dir = str(tmp_path / "project")
     os.makedirs(project_dir)
     path = export(
         _make_assembled(), project_dir, "test_story",
         _make_metadata(), _make_cast(), _make_settings(), 10,
     )
-    reloaded = AudioSegment.from_mp3(path)
-    assert len(reloaded) > 0
+    assert os.path.getsize(path) > 128
+    assert _mpeg_sync_after_id3(path)
+
+
+def test_export_8bit_keeps_level(tmp_path):
+    """8-bit audio (signed in pydub) is encoded at its own level."""
+    from pydub.generators import Sine
+
+    project_dir = str(tmp_path / "project")
+    os.makedirs(project_dir)
+    tone = Sine(440).to_audio_segment(duration=2000, volume=-3.0).set_sample_width(1)
+    path = export(
+        tone, project_dir, "test_story",
+        _make_metadata(), _make_cast(), _make_settings(), 10,
+    )
+    assert abs(AudioSegment.from_mp3(path).dBFS - tone.dBFS) < 1.0
 
 
 def test_export_has_metadata(tmp_path):
@@ -99,6 +125,7 @@ def test_manifest_has_required_fields(tmp_path):
     for field in ["project", "source", "generated_at", "producer_version",
                    "metadata", "cast", "settings", "stats"]:
         assert field in data, f"Missing field: {field}"
+    assert data["settings"]["bitrate"] == "192k"
 
 
 def test_manifest_cast_matches_actual(tmp_path):
@@ -114,3 +141,21 @@ def test_manifest_cast_matches_actual(tmp_path):
     with open(manifest_path) as f:
         data = json.load(f)
     assert data["cast"] == cast
+
+
+def test_manifest_duration_from_prerendered(tmp_path, silent_mp3):
+    """A remuxed prerendered MP3's own length goes in the manifest."""
+    project_dir = str(tmp_path / "project")
+    os.makedirs(project_dir)
+    prerendered = tmp_path / "stitched.mp3"
+    prerendered.write_bytes(silent_mp3(8000, 24000))
+    export(
+        _make_assembled(5000), project_dir, "test_story",
+        _make_metadata(), _make_cast(), _make_settings(), 10,
+        prerendered=str(prerendered),
+    )
+    with open(os.path.join(project_dir, "final", "output.json")) as f:
+        data = json.load(f)
+    assert abs(data["stats"]["duration_seconds"] - 8.0) <= 0.1
+    # The stitched file keeps its own encoding, not the 192k re-encode
+    assert data["settings"]["bitrate"] == f"{bitrate_kbps(str(prerendered))}k" != "192k"
@@ -3,10 +3,9 @@
 import json
 import os
 import shutil
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
-from pydub import AudioSegment
 
 from audiobook_producer.parser import parse_story, extract_metadata
 from audiobook_producer.voices import assign_voices, load_cast, generate_intro_segments, generate_outro_segments
@@ -22,6 +21,7 @@ from audiobook_producer.artifacts import (
 from audiobook_producer.cli import main
 from audiobook_producer.constants import OUTPUT_DIR, NARRATOR_VOICE, NARRATOR_DIALOGUE_VOICE
 from audiobook_producer.models import Segment
+from audiobook_producer.mp3 import bitrate_kbps
 
 
 DEMO_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "demo")
@@ -29,17 +29,6 @@ TTH_PATH = os.path.join(DEMO_DIR, "tell_tale_heart.txt")
 TOW_PATH = os.path.join(DEMO_DIR, "the_open_window.txt")
 
 
-def _mock_tts_communicate():
-    """Create a mock edge_tts.Communicate factory."""
-    def factory(text, voice, **kwargs):
-        mock = MagicMock()
-        async def save(path):
-            AudioSegment.silent(duration=100).export(path, format="mp3")
-        mock.save = save
-        return mock
-    return factory
-
-
 # --- Tell-Tale Heart ---
 
 def test_parse_tell_tale_heart():
@@ -55,13 +44,8 @@ def test_parse_tell_tale_heart():
         assert seg.text.strip() != ""
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_pipeline_tell_tale_heart(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_pipeline_tell_tale_heart(mock_communicate, tmp_path, monkeypatch, silent_mp3):
     """Full pipeline produces valid MP3 with bundled music source."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
 
     # Run new
     with patch("sys.argv", ["producer.py", "new", TTH_PATH]):
@@ -74,9 +58,7 @@ def test_pipeline_tell_tale_heart(mock_which, mock_comm, tmp_path, monkeypatch):
     # Create fake bundled music
     bundled_dir = tmp_path / "demo" / "music"
     bundled_dir.mkdir(parents=True, exist_ok=True)
-    AudioSegment.silent(duration=5000).export(
-        str(bundled_dir / "tell_tale_heart.mp3"), format="mp3"
-    )
+    (bundled_dir / "tell_tale_heart.mp3").write_bytes(silent_mp3(5000, 11025))
     monkeypatch.setattr("audiobook_producer.music.BUNDLED_MUSIC_DIR", str(bundled_dir))
 
     # Run pipeline
@@ -85,29 +67,23 @@ def test_pipeline_tell_tale_heart(mock_which, mock_comm, tmp_path, monkeypatch):
 
     # Verify output
     final_mp3 = os.path.join(project_dir, "final", f"{slug}.mp3")
-    assert os.path.exists(final_mp3)
-    audio = AudioSegment.from_mp3(final_mp3)
-    assert len(audio) > 0
+    assert os.path.getsize(final_mp3) > 0
 
     # Verify music source — should be bundled
     direction = load_artifact(project_dir, "direction.json")
     assert direction["music_source"] == "bundled:tell_tale_heart.mp3"
 
-    # Verify output.json
+    # Verify output.json; its duration is the length that was encoded
     manifest_path = os.path.join(project_dir, "final", "output.json")
     assert os.path.exists(manifest_path)
     with open(manifest_path) as f:
         manifest = json.load(f)
     assert manifest["settings"]["music_source"] == "bundled:tell_tale_heart.mp3"
+    assert manifest["stats"]["duration_seconds"] > 0
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_pipeline_tell_tale_heart_intro_outro(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_pipeline_tell_tale_heart_intro_outro(mock_communicate, tmp_path):
     """Verify intro has title/author/cast, outro has credits + thank you."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
 
     with patch("sys.argv", ["producer.py", "new", TTH_PATH]):
         main()
@@ -142,13 +118,9 @@ def test_parse_open_window():
     assert len(speakers) >= 2  # at least narrator + one character
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_pipeline_open_window(mock_which, mock_comm, tmp_path, monkeypatch):
+@pytest.mark.slow
+def test_pipeline_open_window(mock_communicate, tmp_path, monkeypatch, silent_mp3):
     """Full pipeline produces valid MP3 with bundled music."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
 
     with patch("sys.argv", ["producer.py", "new", TOW_PATH]):
         main()
@@ -159,9 +131,7 @@ def test_pipeline_open_window(mock_which, mock_comm, tmp_path, monkeypatch):
     # Create fake bundled music
     bundled_dir = tmp_path / "demo" / "music"
     bundled_dir.mkdir(parents=True, exist_ok=True)
-    AudioSegment.silent(duration=5000).export(
-        str(bundled_dir / "the_open_window.mp3"), format="mp3"
-    )
+    (bundled_dir / "the_open_window.mp3").write_bytes(silent_mp3(5000, 11025))
     monkeypatch.setattr("audiobook_producer.music.BUNDLED_MUSIC_DIR", str(bundled_dir))
 
     with patch("sys.argv", ["producer.py", "run", slug]):
@@ -174,13 +144,8 @@ def test_pipeline_open_window(mock_which, mock_comm, tmp_path, monkeypatch):
     assert direction["music_source"] == "bundled:the_open_window.mp3"
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_pipeline_open_window_aliases(mock_which, mock_comm, tmp_path, monkeypatch):
+def test_pipeline_open_window_aliases(mock_communicate, tmp_path):
     """Verify alias resolution: 'the child' and 'the niece' same voice."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
 
     with patch("sys.argv", ["producer.py", "new", TOW_PATH]):
         main()
@@ -208,13 +173,9 @@ def test_pipeline_open_window_aliases(mock_which, mock_comm, tmp_path, monkeypat
 
 # --- Cross-cutting ---
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_full_pipeline_no_music(mock_which, mock_comm, tmp_path, monkeypatch):
+@pytest.mark.slow
+def test_full_pipeline_no_music(mock_communicate, tmp_path):
     """Run with music off, verify output has no music."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
 
     with patch("sys.argv", ["producer.py", "new", TTH_PATH]):
         main()
@@ -229,17 +190,20 @@ def test_full_pipeline_no_music(mock_which, mock_comm, tmp_path, monkeypatch):
     with patch("sys.argv", ["producer.py", "run", slug]):
         main()
 
-    final_mp3 = os.path.join(str(tmp_path / "output" / slug), "final", f"{slug}.mp3")
+    project_dir = str(tmp_path / "output" / slug)
+    final_mp3 = os.path.join(project_dir, "final", f"{slug}.mp3")
     assert os.path.exists(final_mp3)
 
+    # Stitched without re-encoding: the manifest has the file's real
+    # bitrate, and no pause silences are left behind in samples/
+    manifest = load_artifact(os.path.join(project_dir, "final"), "output.json")
+    assert manifest["settings"]["bitrate"] == f"{bitrate_kbps(final_mp3)}k" != "192k"
+    assert not [f for f in os.listdir(os.path.join(project_dir, "samples")) if f.startswith("_")]
+
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_full_pipeline_bookend_structure(mock_which, mock_comm, tmp_path, monkeypatch):
+@pytest.mark.slow
+def test_full_pipeline_bookend_structure(mock_communicate, tmp_path):
     """Verify output audio has bookend structure (longer than just story)."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
 
     with patch("sys.argv", ["producer.py", "new", TTH_PATH]):
         main()
@@ -249,20 +213,16 @@ def test_full_pipeline_bookend_structure(mock_which, mock_comm, tmp_path, monkey
         main()
 
     project_dir = str(tmp_path / "output" / slug)
-    final_mp3 = os.path.join(project_dir, "final", f"{slug}.mp3")
-    audio = AudioSegment.from_mp3(final_mp3)
+    assert os.path.getsize(os.path.join(project_dir, "final", f"{slug}.mp3")) > 0
+    manifest = load_artifact(os.path.join(project_dir, "final"), "output.json")
 
     # Should be longer than just segments (has bookend music)
-    assert len(audio) > 1000  # at least 1 second
+    assert manifest["stats"]["duration_seconds"] > 1  # at least 1 second
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_full_pipeline_output_dir(mock_which, mock_comm, tmp_path, monkeypatch):
+@pytest.mark.slow
+def test_full_pipeline_output_dir(mock_communicate, tmp_path):
     """Verify output directory contains all expected artifacts."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
 
     with patch("sys.argv", ["producer.py", "new", TTH_PATH]):
         main()
@@ -289,13 +249,9 @@ def test_full_pipeline_output_dir(mock_which, mock_comm, tmp_path, monkeypatch):
     assert "music_source" in manifest["settings"]
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-@patch("shutil.which", return_value="/usr/bin/ffmpeg")
-def test_full_pipeline_resume(mock_which, mock_comm, tmp_path, monkeypatch):
+@pytest.mark.slow
+def test_full_pipeline_resume(mock_communicate, tmp_path):
     """Second run skips TTS (verify via mock call count)."""
-    monkeypatch.setattr("audiobook_producer.cli.OUTPUT_DIR", str(tmp_path / "output"))
-    monkeypatch.setattr("audiobook_producer.artifacts.OUTPUT_DIR", str(tmp_path / "output"))
-    mock_comm.side_effect = _mock_tts_communicate()
 
     with patch("sys.argv", ["producer.py", "new", TTH_PATH]):
         main()
@@ -306,14 +262,13 @@ def test_full_pipeline_resume(mock_which, mock_comm, tmp_path, monkeypatch):
     with patch("sys.argv", ["producer.py", "run", slug]):
         main()
 
-    first_call_count = mock_comm.call_count
+    first_call_count = mock_communicate.call_count
 
     # Reset and run again
-    mock_comm.reset_mock()
-    mock_comm.side_effect = _mock_tts_communicate()
+    mock_communicate.reset_mock()
 
     with patch("sys.argv", ["producer.py", "run", slug]):
         main()
 
     # Second run should have fewer TTS calls (skipped)
-    assert mock_comm.call_count < first_call_count
+    assert mock_communicate.call_count < first_call_count
@@ -0,0 +1,61 @@
+"""Tests for mp3 module (frame-header lengths)."""
+
+import subprocess
+
+import pytest
+from pydub import AudioSegment
+
+from audiobook_producer.mp3 import bitrate_kbps, duration_ms, stream_samples
+
+
+@pytest.mark.parametrize("frame_rate, samples_per_frame", [(24000, 576), (44100, 1152)])
+def test_stream_samples_whole_frames(tmp_path, silent_mp3, frame_rate, samples_per_frame):
+    """Counts whole frames, the Info header frame excluded."""
+    path = tmp_path / "a.mp3"
+    path.write_bytes(silent_mp3(1000, frame_rate))
+    samples, rate = stream_samples(str(path))
+    assert rate == frame_rate
+    assert samples % samples_per_frame == 0
+    # Decoded length plus encoder delay and padding: under three frames more
+    decoded = int(AudioSegment.from_mp3(str(path)).frame_count())
+    assert decoded < samples < decoded + 3 * samples_per_frame
+
+
+def test_stream_samples_skips_id3_tag(tmp_path, silent_mp3):
+    """A leading ID3v2 tag doesn't change the count."""
+    plain = tmp_path / "plain.mp3"
+    plain.write_bytes(silent_mp3(1000, 24000))
+    tagged = tmp_path / "tagged.mp3"
+    subprocess.run(
+        [AudioSegment.converter, "-y", "-loglevel", "error", "-i", str(plain),
+         "-c", "copy", "-metadata", "title=" + "x" * 500, "-id3v2_version", "4",
+         str(tagged)],
+        check=True,
+    )
+    assert stream_samples(str(tagged)) == stream_samples(str(plain))
+
+
+def test_duration_ms(tmp_path, silent_mp3):
+    """Milliseconds from the frame count, within the encoder overhead."""
+    path = tmp_path / "a.mp3"
+    path.write_bytes(silent_mp3(2000, 24000))
+    assert 2000 <= duration_ms(str(path)) < 2100
+
+
+@pytest.mark.parametrize("bitrate", ["48k", "192k"])
+def test_bitrate_kbps(tmp_path, bitrate):
+    """A constant-bitrate file reports the bitrate it was encoded at."""
+    path = tmp_path / "a.mp3"
+    AudioSegment.silent(duration=1000, frame_rate=44100).export(
+        str(path), format="mp3", bitrate=bitrate,
+    )
+    assert bitrate_kbps(str(path)) == int(bitrate[:-1])
+
+
+@pytest.mark.parametrize("content", [b"", b"not an mp3 at all"], ids=["empty", "garbage"])
+def test_stream_samples_rejects_non_mp3(tmp_path, content):
+    """Files without Layer III frames raise ValueError."""
+    path = tmp_path / "bad.mp3"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        stream_samples(str(path))
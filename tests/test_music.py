@@ -1,8 +1,10 @@
 """Tests for music module (Layer 1d)."""
 
+import io
 import json
 import os
 
+import numpy as np
 import pytest
 from pydub import AudioSegment
 
@@ -10,68 +12,80 @@ from audiobook_producer.music import (
     generate_music,
     generate_procedural_music,
     load_and_prepare_music,
+    _fade_out,
 )
 from audiobook_producer.constants import MUSIC_LOOP_SECONDS, MUSIC_FADE_MS
 
 
+@pytest.fixture(scope="module")
+def noisy_mp3():
+    """MP3 bytes of fixed-seed noise 5 s longer than MUSIC_LOOP_SECONDS.
+
+    8 kHz, LAME's lowest rate: the fade check only compares levels, and
+    every test using it decodes the whole file.
+    """
+    samples = np.random.default_rng(0).integers(
+        -10000, 10000, 8000 * (MUSIC_LOOP_SECONDS + 5), dtype=np.int16,
+    )
+    buf = io.BytesIO()
+    AudioSegment(
+        data=samples.tobytes(), sample_width=2, frame_rate=8000, channels=1,
+    ).export(buf, format="mp3")
+    return buf.getvalue()
+
+
 # --- Procedural music ---
 
-def test_procedural_music_returns_audio_segment():
+@pytest.fixture(scope="module")
+def procedural_music():
+    """One procedural bed for the tests below; generation is deterministic."""
+    return generate_procedural_music()
+
+
+def test_procedural_music_returns_audio_segment(procedural_music):
     """Numpy fallback returns AudioSegment."""
-    result = generate_procedural_music()
-    assert isinstance(result, AudioSegment)
+    assert isinstance(procedural_music, AudioSegment)
 
 
-def test_procedural_music_correct_duration():
+def test_procedural_music_correct_duration(procedural_music):
     """Duration ≈ MUSIC_LOOP_SECONDS * 1000 ms (±100ms)."""
-    result = generate_procedural_music()
     expected_ms = MUSIC_LOOP_SECONDS * 1000
-    assert abs(len(result) - expected_ms) < 100
+    assert abs(len(procedural_music) - expected_ms) < 100
 
 
-def test_procedural_music_not_silent():
+def test_procedural_music_not_silent(procedural_music):
     """RMS > 0."""
-    result = generate_procedural_music()
-    assert result.rms > 0
+    assert procedural_music.rms > 0
 
 
 # --- File-based music ---
 
-def test_load_and_prepare_copies_to_target(tmp_path):
+def test_load_and_prepare_copies_to_target(tmp_path, silent_mp3):
     """Source MP3 copied to target path."""
     source = tmp_path / "source.mp3"
     target = tmp_path / "target.mp3"
-    AudioSegment.silent(duration=5000).export(str(source), format="mp3")
+    source.write_bytes(silent_mp3(5000, 11025))
     load_and_prepare_music(str(source), str(target))
     assert target.exists()
 
 
-def test_load_and_prepare_trims_long_file(tmp_path):
+def test_load_and_prepare_trims_long_file(tmp_path, silent_mp3):
     """Long MP3 trimmed to MUSIC_LOOP_SECONDS."""
     source = tmp_path / "long.mp3"
     target = tmp_path / "trimmed.mp3"
     # Create a file longer than MUSIC_LOOP_SECONDS
-    long_audio = AudioSegment.silent(duration=(MUSIC_LOOP_SECONDS + 30) * 1000)
-    long_audio.export(str(source), format="mp3")
+    source.write_bytes(silent_mp3((MUSIC_LOOP_SECONDS + 30) * 1000, 11025))
     result = load_and_prepare_music(str(source), str(target))
     expected_ms = MUSIC_LOOP_SECONDS * 1000
     assert abs(len(result) - expected_ms) < 200
 
 
-def test_load_and_prepare_fade_out(tmp_path):
+def test_load_and_prepare_fade_out(tmp_path, noisy_mp3):
     """Last section of output fades to near-silence."""
     source = tmp_path / "source.mp3"
     target = tmp_path / "faded.mp3"
     # Use loud audio to detect fade
-    import numpy as np
-    samples = np.random.randint(-10000, 10000, 44100 * (MUSIC_LOOP_SECONDS + 5), dtype=np.int16)
-    audio = AudioSegment(
-        data=samples.tobytes(),
-        sample_width=2,
-        frame_rate=44100,
-        channels=1,
-    )
-    audio.export(str(source), format="mp3")
+    source.write_bytes(noisy_mp3)
     result = load_and_prepare_music(str(source), str(target))
     # Last 100ms should be quieter than the middle
     middle = result[len(result) // 2 : len(result) // 2 + 500]
@@ -79,12 +93,25 @@ def test_load_and_prepare_fade_out(tmp_path):
     assert end.rms < middle.rms
 
 
-def test_load_and_prepare_short_file_no_trim(tmp_path):
+@pytest.mark.parametrize("channels", [1, 2])
+def test_fade_out_matches_pydub(channels):
+    """NumPy fade is within a few LSB of pydub's millisecond-stepped fade."""
+    rng = np.random.default_rng(0)
+    samples = rng.integers(-10000, 10000, 44100 * 3 * channels, dtype=np.int16)
+    audio = AudioSegment(
+        data=samples.tobytes(), sample_width=2, frame_rate=44100, channels=channels,
+    )
+    ours = np.frombuffer(_fade_out(audio, 2000).raw_data, np.int16).astype(np.int32)
+    theirs = np.frombuffer(audio.fade_out(2000).raw_data, np.int16).astype(np.int32)
+    assert len(ours) == len(theirs)
+    assert np.abs(ours - theirs).max() <= 10
+
+
+def test_load_and_prepare_short_file_no_trim(tmp_path, silent_mp3):
     """File shorter than MUSIC_LOOP_SECONDS used as-is."""
     source = tmp_path / "short.mp3"
     target = tmp_path / "out.mp3"
-    short_audio = AudioSegment.silent(duration=5000)
-    short_audio.export(str(source), format="mp3")
+    source.write_bytes(silent_mp3(5000, 11025))
     result = load_and_prepare_music(str(source), str(target))
     # Should be approximately the same duration (MP3 encoding adds a few ms)
     assert abs(len(result) - 5000) < 200
@@ -100,11 +127,12 @@ def _setup_project(tmp_path, slug="test_story"):
     return str(project_dir)
 
 
-def test_generate_music_existing_background(tmp_path):
+def test_generate_music_existing_background(tmp_path, silent_mp3):
     """Existing background.mp3 is loaded, not overwritten."""
     project_dir = _setup_project(tmp_path)
     bg = os.path.join(project_dir, "music", "background.mp3")
-    AudioSegment.silent(duration=5000).export(bg, format="mp3")
+    with open(bg, "wb") as f:
+        f.write(silent_mp3(5000, 11025))
     # Write direction.json with provenance
     direction = {"music_source": "bundled:test.mp3"}
     with open(os.path.join(project_dir, "direction.json"), "w") as f:
@@ -114,11 +142,12 @@ def test_generate_music_existing_background(tmp_path):
     assert source == "bundled:test.mp3"
 
 
-def test_generate_music_existing_reads_provenance(tmp_path):
+def test_generate_music_existing_reads_provenance(tmp_path, silent_mp3):
     """Existing background.mp3 preserves provenance from direction.json."""
     project_dir = _setup_project(tmp_path)
     bg = os.path.join(project_dir, "music", "background.mp3")
-    AudioSegment.silent(duration=5000).export(bg, format="mp3")
+    with open(bg, "wb") as f:
+        f.write(silent_mp3(5000, 11025))
     direction = {"music_source": "user:custom.mp3"}
     with open(os.path.join(project_dir, "direction.json"), "w") as f:
         json.dump(direction, f)
@@ -126,24 +155,24 @@ def test_generate_music_existing_reads_provenance(tmp_path):
     assert source == "user:custom.mp3"
 
 
-def test_generate_music_user_file(tmp_path):
+def test_generate_music_user_file(tmp_path, silent_mp3):
     """music_file arg copies to music/ and returns user: source."""
     project_dir = _setup_project(tmp_path)
     user_file = tmp_path / "my_track.mp3"
-    AudioSegment.silent(duration=5000).export(str(user_file), format="mp3")
+    user_file.write_bytes(silent_mp3(5000, 11025))
     audio, source = generate_music(project_dir, music_file=str(user_file))
     assert isinstance(audio, AudioSegment)
     assert source == "user:my_track.mp3"
 
 
-def test_generate_music_bundled_demo(tmp_path, monkeypatch):
+def test_generate_music_bundled_demo(tmp_path, monkeypatch, silent_mp3):
     """Project slug matching demo uses bundled music."""
     project_dir = _setup_project(tmp_path, slug="tell_tale_heart")
     # Create a fake bundled music file
     bundled_dir = tmp_path / "demo" / "music"
     bundled_dir.mkdir(parents=True)
     bundled_file = bundled_dir / "tell_tale_heart.mp3"
-    AudioSegment.silent(duration=5000).export(str(bundled_file), format="mp3")
+    bundled_file.write_bytes(silent_mp3(5000, 11025))
     monkeypatch.setattr("audiobook_producer.music.BUNDLED_MUSIC_DIR", str(bundled_dir))
     audio, source = generate_music(project_dir)
     assert isinstance(audio, AudioSegment)
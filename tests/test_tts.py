@@ -1,56 +1,43 @@
 """Tests for TTS module (Layer 1c)."""
 
 import asyncio
-from unittest.mock import patch, AsyncMock, MagicMock
+import os
+import shutil
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
-from pydub import AudioSegment
 
 from audiobook_producer.models import Segment
-from audiobook_producer.tts import generate_single, generate_tts
+from audiobook_producer.tts import generate_single, generate_tts, segment_paths
 
 
-def _make_mock_communicate(tiny_mp3_path):
-    """Create a mock edge_tts.Communicate that writes a tiny MP3."""
-    def factory(text, voice, **kwargs):
-        mock = MagicMock()
-        async def save(path):
-            silence = AudioSegment.silent(duration=100)
-            silence.export(path, format="mp3")
-        mock.save = save
-        return mock
-    return factory
-
-
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-def test_tts_generate_single(mock_comm, tmp_path):
+def test_tts_generate_single(mock_communicate, tmp_path):
     """Single TTS file created at specified path."""
     output = tmp_path / "test.mp3"
-    mock_comm.side_effect = _make_mock_communicate(None)
     generate_single("Hello world", "en-US-GuyNeural", str(output))
     assert output.exists()
     assert output.stat().st_size > 0
 
 
 @patch("audiobook_producer.tts.edge_tts.Communicate")
-def test_tts_generate_single_retry(mock_comm, tmp_path):
+def test_tts_generate_single_retry(mock_comm, tmp_path, monkeypatch, silent_mp3):
     """Retry works when first attempt fails."""
+    monkeypatch.setattr("audiobook_producer.tts.TTS_RETRY_BASE_DELAY", 0)
     output = tmp_path / "test.mp3"
     call_count = 0
 
     def fail_then_succeed(text, voice, **kwargs):
         nonlocal call_count
         call_count += 1
-        mock = MagicMock()
         if call_count == 1:
             async def fail_save(path):
                 raise Exception("Network error")
-            mock.save = fail_save
-        else:
-            async def ok_save(path):
-                AudioSegment.silent(duration=100).export(path, format="mp3")
-            mock.save = ok_save
-        return mock
+            return SimpleNamespace(save=fail_save)
+        async def ok_save(path):
+            with open(path, "wb") as f:
+                f.write(silent_mp3(100))
+        return SimpleNamespace(save=ok_save)
 
     mock_comm.side_effect = fail_then_succeed
     generate_single("Hello", "en-US-GuyNeural", str(output))
@@ -58,10 +45,8 @@ def test_tts_generate_single_retry(mock_comm, tmp_path):
     assert call_count == 2
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-def test_tts_generates_files(mock_comm, tmp_path):
+def test_tts_generates_files(mock_communicate, tmp_path):
     """N files created in output directory."""
-    mock_comm.side_effect = _make_mock_communicate(None)
     segments = [
         Segment(type="narration", text="Dark.", speaker="narrator", voice="en-US-GuyNeural"),
         Segment(type="dialogue", text="Who?", speaker="old man", voice="en-US-DavisNeural"),
@@ -74,14 +59,13 @@ def test_tts_generates_files(mock_comm, tmp_path):
 
 
 @patch("audiobook_producer.tts.edge_tts.Communicate")
-def test_tts_retry_exhausted(mock_comm, tmp_path):
+def test_tts_retry_exhausted(mock_comm, tmp_path, monkeypatch):
     """Raises after all retries exhausted."""
+    monkeypatch.setattr("audiobook_producer.tts.TTS_RETRY_BASE_DELAY", 0)
     def always_fail(text, voice, **kwargs):
-        mock = MagicMock()
         async def fail_save(path):
             raise Exception("Permanent failure")
-        mock.save = fail_save
-        return mock
+        return SimpleNamespace(save=fail_save)
 
     mock_comm.side_effect = always_fail
     output = tmp_path / "fail.mp3"
@@ -90,20 +74,20 @@ def test_tts_retry_exhausted(mock_comm, tmp_path):
 
 
 @patch("audiobook_producer.tts.edge_tts.Communicate")
-def test_tts_validates_output_size(mock_comm, tmp_path):
+def test_tts_validates_output_size(mock_comm, tmp_path, monkeypatch, silent_mp3):
     """0-byte output treated as failure."""
+    monkeypatch.setattr("audiobook_producer.tts.TTS_RETRY_BASE_DELAY", 0)
     call_count_outer = [0]
 
     def write_empty(text, voice, **kwargs):
-        mock = MagicMock()
         async def save(path):
             call_count_outer[0] += 1
             if call_count_outer[0] <= 2:
                 open(path, "w").close()  # 0-byte file
             else:
-                AudioSegment.silent(duration=100).export(path, format="mp3")
-        mock.save = save
-        return mock
+                with open(path, "wb") as f:
+                    f.write(silent_mp3(100))
+        return SimpleNamespace(save=save)
 
     mock_comm.side_effect = write_empty
     output = tmp_path / "test.mp3"
@@ -111,10 +95,8 @@ def test_tts_validates_output_size(mock_comm, tmp_path):
     assert output.stat().st_size > 0
 
 
-@patch("audiobook_producer.tts.edge_tts.Communicate")
-def test_tts_progress_output(mock_comm, tmp_path, capsys):
+def test_tts_progress_output(mock_communicate, tmp_path, capsys):
     """Segment counter appears in stdout."""
-    mock_comm.side_effect = _make_mock_communicate(None)
     segments = [
         Segment(type="narration", text="Line one.", speaker="narrator", voice="en-US-GuyNeural"),
         Segment(type="narration", text="Line two.", speaker="narrator", voice="en-US-GuyNeural"),
@@ -124,3 +106,145 @@ def test_tts_progress_output(mock_comm, tmp_path, capsys):
     generate_tts(segments, str(seg_dir))
     captured = capsys.readouterr()
     assert "1/" in captured.out or "2/" in captured.out
+
+
+@patch("audiobook_producer.tts.edge_tts.Communicate")
+def test_tts_parallel_dispatch(mock_comm, tmp_path, silent_mp3):
+    """Requests overlap, but never more than `concurrency` at once."""
+    in_flight = 0
+    peak = 0
+
+    def counting(text, voice, **kwargs):
+        async def save(path):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            with open(path, "wb") as f:
+                f.write(silent_mp3(100))
+        return SimpleNamespace(save=save)
+
+    mock_comm.side_effect = counting
+    segments = [
+        Segment(type="narration", text=f"Line {i}.", speaker="narrator", voice="en-US-GuyNeural")
+        for i in range(20)
+    ]
+    seg_dir = tmp_path / "segments"
+    seg_dir.mkdir()
+    generate_tts(segments, str(seg_dir), concurrency=5)
+    assert peak == 5
+
+
+@patch("audiobook_producer.tts.edge_tts.Communicate")
+def test_tts_failed_segment_does_not_cancel_others(mock_comm, tmp_path, monkeypatch, silent_mp3):
+    """One failing segment is reported after the rest have been generated."""
+    monkeypatch.setattr("audiobook_producer.tts.TTS_RETRY_BASE_DELAY", 0)
+
+    def fail_on_bad(text, voice, **kwargs):
+        async def save(path):
+            if text == "Bad.":
+                raise Exception("Permanent failure")
+            with open(path, "wb") as f:
+                f.write(silent_mp3(100))
+        return SimpleNamespace(save=save)
+
+    mock_comm.side_effect = fail_on_bad
+    segments = [
+        Segment(type="narration", text="Bad.", speaker="narrator", voice="en-US-GuyNeural"),
+        Segment(type="narration", text="Good.", speaker="narrator", voice="en-US-GuyNeural"),
+        Segment(type="narration", text="Also good.", speaker="narrator", voice="en-US-GuyNeural"),
+    ]
+    seg_dir = tmp_path / "segments"
+    seg_dir.mkdir()
+    with pytest.raises(Exception, match="Permanent failure"):
+        generate_tts(segments, str(seg_dir), concurrency=2)
+    assert len(list(seg_dir.glob("*.mp3"))) == 2
+
+
+def test_tts_postprocess_runs_once_per_new_file(mock_communicate, tmp_path, silent_mp3):
+    """postprocess sees each downloaded file once; existing files are skipped."""
+    segments = [
+        Segment(type="narration", text="Dark.", speaker="narrator", voice="en-US-GuyNeural"),
+        Segment(type="dialogue", text="Who?", speaker="old man", voice="en-US-DavisNeural"),
+    ]
+    seg_dir = tmp_path / "segments"
+    seg_dir.mkdir()
+    existing = segment_paths(segments, str(seg_dir))[0]
+    with open(existing, "wb") as f:
+        f.write(silent_mp3(100))
+
+    calls = []
+    paths = generate_tts(
+        segments, str(seg_dir),
+        postprocess=lambda path, seg_type: calls.append((path, seg_type)),
+    )
+    assert calls == [(paths[1] + ".part", "dialogue")]
+    assert sorted(p.name for p in seg_dir.iterdir()) == sorted(
+        os.path.basename(p) for p in paths
+    )
+
+
+@patch("audiobook_producer.tts.edge_tts.Communicate")
+def test_tts_retry_backoff_frees_slot(mock_comm, tmp_path, monkeypatch, silent_mp3):
+    """A segment sleeping between retries doesn't hold its concurrency slot."""
+    monkeypatch.setattr("audiobook_producer.tts.TTS_RETRY_BASE_DELAY", 0.5)
+    attempts = {"Flaky.": 0}
+
+    def flaky(text, voice, **kwargs):
+        async def save(path):
+            if text == "Flaky." and attempts["Flaky."] == 0:
+                attempts["Flaky."] += 1
+                raise Exception("Network error")
+            with open(path, "wb") as f:
+                f.write(silent_mp3(100))
+        return SimpleNamespace(save=save)
+
+    mock_comm.side_effect = flaky
+    segments = [
+        Segment(type="narration", text="Flaky.", speaker="narrator", voice="en-US-GuyNeural"),
+        Segment(type="narration", text="Steady.", speaker="narrator", voice="en-US-GuyNeural"),
+    ]
+    seg_dir = tmp_path / "segments"
+    seg_dir.mkdir()
+    order = []
+    generate_tts(
+        segments, str(seg_dir), concurrency=1,
+        postprocess=lambda path, seg_type: order.append(os.path.basename(path)),
+    )
+    # With concurrency=1, "Steady." only finishes first if the slot was freed
+    assert order[0].startswith("001_")
+
+
+def test_tts_identical_requests_share_one_download(mock_communicate, tmp_path):
+    """Same text + voice is requested once, in a run and across runs."""
+    segments = [
+        Segment(type="narration", text="The end.", speaker="narrator", voice="en-US-GuyNeural"),
+        Segment(type="dialogue", text="Hello.", speaker="bob", voice="en-US-DavisNeural"),
+        Segment(type="narration", text="The end.", speaker="narrator", voice="en-US-GuyNeural"),
+    ]
+    seg_dir = tmp_path / "segments"
+    seg_dir.mkdir()
+    cache_dir = str(tmp_path / "tts_cache")
+
+    paths = generate_tts(segments, str(seg_dir), cache_dir=cache_dir)
+    assert mock_communicate.call_count == 2
+    assert all(os.path.getsize(p) > 0 for p in paths)
+
+    # Segments cleared (e.g. by an effects change): served from the cache
+    shutil.rmtree(seg_dir)
+    seg_dir.mkdir()
+    generate_tts(segments, str(seg_dir), cache_dir=cache_dir)
+    assert mock_communicate.call_count == 2
+    assert len(os.listdir(cache_dir)) == 2
+
+
+def test_segment_paths_follow_segment_order(tmp_path):
+    """Paths are index-derived and stay in order past 999 segments."""
+    segments = [
+        Segment(type="narration", text="x", speaker="narrator", voice="en-US-GuyNeural")
+    ] * 1001
+    paths = segment_paths(segments, str(tmp_path))
+    assert paths[0].endswith("000_narration_narrator.mp3")
+    assert paths[100].endswith("100_narration_narrator.mp3")
+    assert paths[1000].endswith("1000_narration_narrator.mp3")
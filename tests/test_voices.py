@@ -29,6 +29,20 @@ def test_narrator_dialogue_gets_distinct_voice(sample_segments):
     assert all(s.voice == NARRATOR_DIALOGUE_VOICE for s in narrator_dialogue)
 
 
+def test_speaker_case_insensitive():
+    """Speakers match regardless of case, including the narrator."""
+    segments = [
+        Segment(type="dialogue", text="Hi.", speaker="Bob"),
+        Segment(type="dialogue", text="Hey.", speaker="bob"),
+        Segment(type="narration", text="Dark.", speaker="Narrator"),
+        Segment(type="dialogue", text="Who?", speaker="Narrator"),
+    ]
+    assign_voices(segments, cast={"cast": {"Bob": {"voice": "en-US-AriaNeural"}}})
+    assert [s.voice for s in segments] == [
+        "en-US-AriaNeural", "en-US-AriaNeural", NARRATOR_VOICE, NARRATOR_DIALOGUE_VOICE,
+    ]
+
+
 def test_cast_overrides_hash():
     """Character in cast file gets the cast voice."""
     segments = [Segment(type="dialogue", text="Hello", speaker="bob")]
@@ -91,6 +105,19 @@ def test_load_cast_malformed_json(tmp_path):
     assert result == {}
 
 
+@pytest.mark.parametrize("raw, expected", [
+    ('{"cast": {"bob": {"voice": "en-US-AriaNeural"}}}', {"cast": {"bob": {"voice": "en-US-AriaNeural"}}}),
+    ("{bad json", {}),
+], ids=["valid", "malformed"])
+def test_load_cast_without_orjson(tmp_path, monkeypatch, raw, expected):
+    """The stdlib json fallback parses and rejects cast files the same way."""
+    monkeypatch.setattr("audiobook_producer.voices.ORJSON_AVAILABLE", False)
+    story = tmp_path / "story.txt"
+    story.write_text("content")
+    (tmp_path / "story.cast.json").write_text(raw)
+    assert load_cast(str(story)) == expected
+
+
 def test_cast_narrator_override():
     """Cast file narrator key overrides NARRATOR_VOICE."""
     segments = [Segment(type="narration", text="Dark.", speaker="narrator")]